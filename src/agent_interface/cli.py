@@ -1,4 +1,7 @@
 """CLI main entry point for JSON-RPC agent interface."""
+import socket
+import sqlite3
+import struct
 import sys
 from pathlib import Path
 from typing import Any, Optional
@@ -6,6 +9,7 @@ from typing import Any, Optional
 from ..cad_kernel.entity_manager import EntityManager
 from ..cad_kernel.geometry_core import get_geometry_core
 from ..cad_kernel.workspace import WorkspaceManager
+from ..file_io.async_writer import flush_artifact_writes, get_artifact_writer
 from ..operations.history import HistoryManager, HistoryEntry
 from ..persistence.database import Database
 from ..persistence.entity_store import EntityStore
@@ -13,6 +17,7 @@ from ..persistence.operation_log import OperationLog
 from ..persistence.workspace_store import WorkspaceStore
 from ..utils.logger import get_logger
 from ..utils.performance_tracker import PerformanceTracker
+from ..utils.timestamps import request_timestamp, utc_now_iso
 from .agent_metrics import MetricsTracker
 from .command_parser import CommandParser
 from .error_handler import ErrorCode, ErrorHandler
@@ -83,6 +88,7 @@ class CLI:
         # Method dispatch table
         self.methods = {
             "entity.create.point": self._handle_create_point,
+            "entity.create.points": self._handle_create_points,
             "entity.create.line": self._handle_create_line,
             "entity.create.circle": self._handle_create_circle,
             "entity.query": self._handle_entity_query,
@@ -102,6 +108,7 @@ class CLI:
             "solid.pattern.circular": self._handle_pattern_circular,
             "solid.mirror": self._handle_solid_mirror,
             "workspace.create": self._handle_workspace_create,
+            "workspace.create_batch": self._handle_workspace_create_batch,
             "workspace.list": self._handle_workspace_list,
             "workspace.switch": self._handle_workspace_switch,
             "workspace.status": self._handle_workspace_status,
@@ -112,6 +119,7 @@ class CLI:
             "history.redo": self._handle_history_redo,
             "file.export": self._handle_file_export,
             "file.import": self._handle_file_import,
+            "file.flush": self._handle_file_flush,
             "agent.metrics": self._handle_agent_metrics,
             "scenario.run": self._handle_scenario_run,
         }
@@ -137,13 +145,13 @@ class CLI:
 
         cursor = self.database.connection.cursor()
         cursor.execute("""
-            SELECT constraint_id, constraint_type, workspace_id, constrained_entities, parameters
+            SELECT constraint_id, constraint_type, workspace_id, constrained_entities, parameters, created_at
             FROM constraints
             WHERE workspace_id = ?
         """, ("main",))
 
         for row in cursor.fetchall():
-            constraint_id, constraint_type, workspace_id, constrained_entities_json, parameters_json = row
+            constraint_id, constraint_type, workspace_id, constrained_entities_json, parameters_json, created_at = row
             entity_ids = json.loads(constrained_entities_json)
             parameters = json.loads(parameters_json) if parameters_json else {}
 
@@ -161,12 +169,16 @@ class CLI:
                     entity = Point2D(
                         entity_id=entity_data.entity_id,
                         workspace_id=entity_data.workspace_id,
+                        created_at=entity_data.created_at,
+                        updated_at=entity_data.modified_at,
                         coordinates=props.get("coordinates", [])
                     )
                 elif entity_type == "line":
                     entity = Line2D(
                         entity_id=entity_data.entity_id,
                         workspace_id=entity_data.workspace_id,
+                        created_at=entity_data.created_at,
+                        updated_at=entity_data.modified_at,
                         start=props.get("start", []),
                         end=props.get("end", [])
                     )
@@ -174,6 +186,8 @@ class CLI:
                     entity = Circle2D(
                         entity_id=entity_data.entity_id,
                         workspace_id=entity_data.workspace_id,
+                        created_at=entity_data.created_at,
+                        updated_at=entity_data.modified_at,
                         center=props.get("center", []),
                         radius=props.get("radius", 0.0)
                     )
@@ -206,6 +220,7 @@ class CLI:
                 "workspace_id": workspace_id,
                 "entity_ids": entity_ids,
                 "entities": entities,
+                "created_at": created_at,
             }
 
             # Add type-specific parameters
@@ -219,6 +234,14 @@ class CLI:
             constraint = constraint_class(**kwargs)
             self.constraint_graph.add_constraint(constraint)
 
+    def close(self) -> None:
+        """Close the database connection.
+
+        Background artifact writes are not waited for; they belong to the
+        process-wide writer and are reported by file.flush.
+        """
+        self.database.close()
+
     def run(self) -> None:
         """Run CLI main loop, reading from stdin and writing to stdout."""
         self.logger.info("CLI starting", agent_mode=True)
@@ -263,7 +286,9 @@ class CLI:
 
         try:
             handler = self.methods[request.method]
-            result_data = handler(request)
+            # One timestamp for every row and entity this request creates
+            with request_timestamp():
+                result_data = handler(request)
             execution_time_ms = tracker.stop()
 
             # Record successful operation in metrics
@@ -435,6 +460,61 @@ class CLI:
             "coordinates": coordinates
         }
 
+    def _handle_create_points(self, request) -> dict[str, Any]:
+        """Handle entity.create.points request.
+
+        Creates every point in one transaction, so agents laying out many
+        reference points pay one round-trip and one commit.
+        """
+        points = self.parser.get_param(request, "points", required=True)
+        if not isinstance(points, list) or not points:
+            raise ValueError("points must be a non-empty list of coordinates")
+
+        # Validate every point before creating any
+        geometry = []
+        for coordinates in points:
+            is_valid, error_msg = self.geometry_core.validate_point(coordinates)
+            if not is_valid:
+                raise ValueError(error_msg)
+
+            # Normalize to 3D coordinates
+            if len(coordinates) == 2:
+                coordinates = [coordinates[0], coordinates[1], 0.0]
+
+            geometry.append((
+                {"coordinates": coordinates},
+                self.geometry_core.calculate_bounding_box([coordinates])
+            ))
+
+        workspace_id = self.parser.get_param(request, "workspace_id")
+        if workspace_id is None:
+            workspace_id = self._get_active_workspace_id()
+        else:
+            # Resolve full workspace ID if short name provided
+            ws = self.workspace_manager.get_workspace(workspace_id)
+            if ws:
+                workspace_id = ws.workspace_id
+        agent_id = request.params.get("agent_id", "default_agent")
+
+        entities = self.entity_manager.create_entities(
+            entity_type="point",
+            workspace_id=workspace_id,
+            agent_id=agent_id,
+            geometry=geometry
+        )
+
+        return {
+            "workspace_id": workspace_id,
+            "entities": [
+                {
+                    "entity_id": entity.entity_id,
+                    "entity_type": entity.entity_type,
+                    "coordinates": entity.properties["coordinates"]
+                }
+                for entity in entities
+            ]
+        }
+
     def _handle_create_line(self, request) -> dict[str, Any]:
         """Handle entity.create.line request."""
         start = self.parser.get_param(request, "start", required=True)
@@ -736,12 +816,16 @@ class CLI:
                 entity = Point2D(
                     entity_id=entity_data.entity_id,
                     workspace_id=entity_data.workspace_id,
+                    created_at=entity_data.created_at,
+                    updated_at=entity_data.modified_at,
                     coordinates=props.get("coordinates", [])
                 )
             elif entity_type == "line":
                 entity = Line2D(
                     entity_id=entity_data.entity_id,
                     workspace_id=entity_data.workspace_id,
+                    created_at=entity_data.created_at,
+                    updated_at=entity_data.modified_at,
                     start=props.get("start", []),
                     end=props.get("end", [])
                 )
@@ -749,6 +833,8 @@ class CLI:
                 entity = Circle2D(
                     entity_id=entity_data.entity_id,
                     workspace_id=entity_data.workspace_id,
+                    created_at=entity_data.created_at,
+                    updated_at=entity_data.modified_at,
                     center=props.get("center", []),
                     radius=props.get("radius", 0.0)
                 )
@@ -814,7 +900,6 @@ class CLI:
 
         # Persist constraint to database
         import json
-        from datetime import datetime, timezone
         cursor = self.database.connection.cursor()
         cursor.execute("""
             INSERT INTO constraints (
@@ -830,7 +915,7 @@ class CLI:
             json.dumps(parameters),
             constraint.satisfaction_status,
             1,  # Simple DOF calculation
-            datetime.now(timezone.utc).isoformat(),
+            utc_now_iso(),
             "agent"
         ))
 
@@ -851,6 +936,8 @@ class CLI:
 
     def _handle_constraint_status(self, request) -> dict[str, Any]:
         """Handle constraint.status request."""
+        from ..operations.constraints import evaluate_constraints
+
         # Check if querying specific constraint
         constraint_id = self.parser.get_param(request, "constraint_id")
         entity_id = self.parser.get_param(request, "entity_id")
@@ -876,10 +963,8 @@ class CLI:
 
             # Update status for all constraints
             constraint_list = []
-            for constraint in constraints:
-                is_satisfied, error = constraint.check_satisfaction()
-                constraint.satisfaction_status = "satisfied" if is_satisfied else "violated"
-
+            errors = evaluate_constraints(constraints)
+            for constraint, error in zip(constraints, errors):
                 constraint_dict = constraint.to_dict()
                 constraint_dict["satisfaction_error"] = error
                 constraint_list.append(constraint_dict)
@@ -889,10 +974,9 @@ class CLI:
         else:
             # List all constraints
             constraint_list = []
-            for constraint in self.constraint_graph.constraints.values():
-                is_satisfied, error = constraint.check_satisfaction()
-                constraint.satisfaction_status = "satisfied" if is_satisfied else "violated"
-
+            constraints = list(self.constraint_graph.constraints.values())
+            errors = evaluate_constraints(constraints)
+            for constraint, error in zip(constraints, errors):
                 constraint_dict = constraint.to_dict()
                 constraint_dict["satisfaction_error"] = error
                 constraint_list.append(constraint_dict)
@@ -938,6 +1022,8 @@ class CLI:
                 entity = Line2D(
                     entity_id=entity_data.entity_id,
                     workspace_id=entity_data.workspace_id,
+                    created_at=entity_data.created_at,
+                    updated_at=entity_data.modified_at,
                     start=props.get("start", []),
                     end=props.get("end", [])
                 )
@@ -945,6 +1031,8 @@ class CLI:
                 entity = Circle2D(
                     entity_id=entity_data.entity_id,
                     workspace_id=entity_data.workspace_id,
+                    created_at=entity_data.created_at,
+                    updated_at=entity_data.modified_at,
                     center=props.get("center", []),
                     radius=props.get("radius", 0.0)
                 )
@@ -964,16 +1052,9 @@ class CLI:
 
         # Persist solid to database
         import json
-        from datetime import datetime, timezone
-
-        # Calculate bounding box (approximate for now)
-        com = solid.center_of_mass
-        # Simple approximation: extend from center of mass by half the box size
-        # This will be improved when using real OCCT
-        bbox = {
-            "min": [com[0] - 10, com[1] - 10, com[2] - 10],
-            "max": [com[0] + 10, com[1] + 10, com[2] + 10]
-        }
+
+        # extrude_sketch computes the exact axis-aligned bounding box
+        bbox = solid.bounding_box
 
         cursor = self.database.connection.cursor()
         cursor.execute("""
@@ -1037,7 +1118,7 @@ class CLI:
         for entity_id in entity_ids:
             # Read directly from database
             cursor.execute("""
-                SELECT entity_id, entity_type, workspace_id, properties, is_valid, validation_errors
+                SELECT entity_id, entity_type, workspace_id, properties, bounding_box, is_valid, validation_errors
                 FROM entities
                 WHERE entity_id = ? AND workspace_id = ?
             """, (entity_id, workspace_id))
@@ -1046,7 +1127,7 @@ class CLI:
             if row is None:
                 raise ValueError(f"Entity '{entity_id}' not found")
 
-            eid, etype, wid, properties_json, is_valid, validation_errors_json = row
+            eid, etype, wid, properties_json, bounding_box_json, is_valid, validation_errors_json = row
 
             if etype != "solid":
                 raise ValueError(f"Entity '{entity_id}' is not a solid (type: {etype})")
@@ -1072,7 +1153,8 @@ class CLI:
                     is_manifold=topology_data.get("is_manifold", False)
                 ),
                 is_valid=is_valid,
-                validation_errors=validation_errors
+                validation_errors=validation_errors,
+                bounding_box=json.loads(bounding_box_json) if bounding_box_json else None
             )
 
             solids.append(solid)
@@ -1087,14 +1169,16 @@ class CLI:
 
         # Persist result to database
         import json
-        from datetime import datetime, timezone
 
-        # Calculate bounding box
-        com = result_solid.center_of_mass
-        bbox = {
-            "min": [com[0] - 10, com[1] - 10, com[2] - 10],
-            "max": [com[0] + 10, com[1] + 10, com[2] + 10]
-        }
+        # Calculate bounding box, approximating around the center of mass when
+        # an operand had no stored box
+        bbox = result_solid.bounding_box
+        if bbox is None:
+            com = result_solid.center_of_mass
+            bbox = {
+                "min": [com[0] - 10, com[1] - 10, com[2] - 10],
+                "max": [com[0] + 10, com[1] + 10, com[2] + 10]
+            }
 
         cursor = self.database.connection.cursor()
         cursor.execute("""
@@ -1135,7 +1219,6 @@ class CLI:
     def _handle_boolean_union(self, request) -> dict[str, Any]:
         """Handle solid.boolean.union request (A ∪ B)."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import boolean_ops
         from ..cad_kernel.geometry_engine import GeometryShape
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
@@ -1210,8 +1293,8 @@ class CLI:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 entity_id, "solid", workspace_id, result_geo.shape_id,
-                datetime.now(timezone.utc).isoformat(),
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
+                utc_now_iso(),
                 agent_id,
                 json.dumps({"volume": result_props.volume, "surface_area": result_props.surface_area}),
                 json.dumps(bbox),
@@ -1233,7 +1316,7 @@ class CLI:
                 f"union_{uuid.uuid4().hex[:8]}", "UNION",
                 operand1_id, operand2_id, entity_id,
                 workspace_id, agent_id,
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
                 0, True, None
             ))
 
@@ -1268,7 +1351,6 @@ class CLI:
     def _handle_boolean_subtract(self, request) -> dict[str, Any]:
         """Handle solid.boolean.subtract request (A - B)."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import boolean_ops
         from ..cad_kernel.geometry_engine import GeometryShape
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
@@ -1336,8 +1418,8 @@ class CLI:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 entity_id, "solid", workspace_id, result_geo.shape_id,
-                datetime.now(timezone.utc).isoformat(),
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
+                utc_now_iso(),
                 agent_id,
                 json.dumps({"volume": result_props.volume, "surface_area": result_props.surface_area}),
                 json.dumps(bbox),
@@ -1359,7 +1441,7 @@ class CLI:
                 f"subtract_{uuid.uuid4().hex[:8]}", "SUBTRACT",
                 base_id, tool_id, entity_id,
                 workspace_id, agent_id,
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
                 0, True, None
             ))
 
@@ -1394,7 +1476,6 @@ class CLI:
     def _handle_boolean_intersect(self, request) -> dict[str, Any]:
         """Handle solid.boolean.intersect request (A ∩ B)."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import boolean_ops
         from ..cad_kernel.geometry_engine import GeometryShape
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
@@ -1469,8 +1550,8 @@ class CLI:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 entity_id, "solid", workspace_id, result_geo.shape_id,
-                datetime.now(timezone.utc).isoformat(),
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
+                utc_now_iso(),
                 agent_id,
                 json.dumps({"volume": result_props.volume, "surface_area": result_props.surface_area}),
                 json.dumps(bbox),
@@ -1492,7 +1573,7 @@ class CLI:
                 f"intersect_{uuid.uuid4().hex[:8]}", "INTERSECT",
                 operand1_id, operand2_id, entity_id,
                 workspace_id, agent_id,
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
                 0, True, None
             ))
 
@@ -1527,7 +1608,6 @@ class CLI:
     def _handle_solid_primitive(self, request) -> dict[str, Any]:
         """Handle solid.primitive request (box, cylinder, sphere, cone)."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import primitive_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -1631,8 +1711,8 @@ class CLI:
             entity_id,
             "solid",
             workspace_id,
-            datetime.now(timezone.utc).isoformat(),
-            datetime.now(timezone.utc).isoformat(),
+            utc_now_iso(),
+            utc_now_iso(),
             "agent",
             json.dumps([]),
             json.dumps([]),
@@ -1736,6 +1816,46 @@ class CLI:
 
         return workspace.to_dict()
 
+    def _handle_workspace_create_batch(self, request) -> dict[str, Any]:
+        """Handle workspace.create_batch request.
+
+        Creates several workspaces off the same base in one call, so callers
+        setting up many agents pay one round-trip instead of one per workspace.
+        """
+        # Parse parameters
+        workspace_names = self.parser.get_param(request, "workspace_names", required=True)
+        base_workspace_id = self.parser.get_param(request, "base_workspace_id", default="main")
+        agent_id = request.params.get("agent_id", "default_agent")
+
+        if not isinstance(workspace_names, list) or not all(isinstance(name, str) for name in workspace_names):
+            raise ValueError("workspace_names must be a list of strings")
+
+        # Verify base workspace exists
+        base_workspace = self.workspace_manager.get_workspace(base_workspace_id)
+        if base_workspace is None:
+            raise ValueError(f"Base workspace '{base_workspace_id}' not found")
+
+        # Create workspaces
+        workspaces = [
+            self.workspace_manager.create_workspace(
+                workspace_name=workspace_name,
+                workspace_type="agent_branch",
+                base_workspace_id=base_workspace_id,
+                owning_agent_id=agent_id
+            )
+            for workspace_name in workspace_names
+        ]
+
+        # Log operation
+        self.logger.info(
+            f"Created {len(workspaces)} workspaces",
+            base=base_workspace_id
+        )
+
+        return {
+            "workspaces": [ws.to_dict() for ws in workspaces]
+        }
+
     def _handle_workspace_list(self, request) -> dict[str, Any]:
         """Handle workspace.list request."""
         workspaces = self.workspace_manager.list_workspaces()
@@ -1963,12 +2083,11 @@ class CLI:
             import json
             entity_type, _, bbox, is_valid, val_errors, created_at, _, created_by = source_row
             properties = json.dumps(merged_properties)
-            modified_at = datetime.now(timezone.utc).isoformat()
+            modified_at = utc_now_iso()
             resolution_note = "Applied manual merge"
 
         # Update or insert entity in target workspace
         import json
-        from datetime import datetime, timezone
 
         if target_row:
             # Update existing entity
@@ -1976,7 +2095,7 @@ class CLI:
                 UPDATE entities
                 SET properties = ?, modified_at = ?
                 WHERE entity_id = ? AND workspace_id = ?
-            """, (properties, datetime.now(timezone.utc).isoformat(), entity_id, target_workspace_id))
+            """, (properties, utc_now_iso(), entity_id, target_workspace_id))
         else:
             # Insert new entity
             cursor.execute("""
@@ -2011,6 +2130,10 @@ class CLI:
         format_type = self.parser.get_param(request, "format", required=True)
         entity_ids = self.parser.get_param(request, "entity_ids", default=None)
         workspace_id = self.parser.get_param(request, "workspace_id", default=None)
+        # Non-critical artifacts (JSON, binary STL) may be written in the
+        # background; the response is returned once the bytes are queued
+        async_write = self.parser.get_param(request, "async_write", default=False)
+        async_writer = get_artifact_writer() if async_write else None
 
         # Get workspace ID (from param or active workspace)
         if workspace_id is None:
@@ -2066,14 +2189,22 @@ class CLI:
                         })
 
             from ..file_io.json_handler import export_json
-            result = export_json(entities, file_path)
+            result = export_json(
+                entities,
+                file_path,
+                async_writer=async_writer
+            )
 
         # Handle STEP/STL export (3D geometry)
         elif format_type.lower() in ["step", "stl"]:
             from ..file_io.export_manager import ExportManager
 
             # Initialize export manager with database connection
-            export_mgr = ExportManager(self.database.connection)
+            export_mgr = ExportManager(
+                self.database.connection,
+                async_writer=async_writer,
+                cache_dir=self.database.db_path.parent / ".export_cache"
+            )
 
             # Get format-specific options
             format_options = {}
@@ -2112,6 +2243,10 @@ class CLI:
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
+        if async_writer is not None:
+            # Not on disk yet: file.flush waits for it and reports failures
+            result["write_pending"] = True
+
         # Log operation
         self.logger.info(
             f"Exported {result.get('entity_count', 0)} entities to {file_path}",
@@ -2120,6 +2255,15 @@ class CLI:
 
         return result
 
+    def _handle_file_flush(self, request) -> dict[str, Any]:
+        """Handle file.flush request.
+
+        Waits for every background export write (async_write) queued in this
+        process and raises if any of them failed since the last flush.
+        """
+        flush_artifact_writes()
+        return {"flushed": True}
+
     def _handle_file_import(self, request) -> dict[str, Any]:
         """Handle file.import request."""
         # Parse parameters
@@ -2471,7 +2615,6 @@ class CLI:
     def _handle_solid_revolve(self, request) -> dict[str, Any]:
         """Handle solid.revolve request - revolve 2D profile around axis."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import creation_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2493,7 +2636,6 @@ class CLI:
     def _handle_solid_loft(self, request) -> dict[str, Any]:
         """Handle solid.loft request - loft between multiple profiles."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import creation_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2511,7 +2653,6 @@ class CLI:
     def _handle_solid_sweep(self, request) -> dict[str, Any]:
         """Handle solid.sweep request - sweep profile along path."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import creation_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2532,7 +2673,6 @@ class CLI:
     def _handle_pattern_linear(self, request) -> dict[str, Any]:
         """Handle solid.pattern.linear request - create linear pattern of copies."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import pattern_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2627,8 +2767,8 @@ class CLI:
                     entity_id,
                     "solid",
                     workspace_id,
-                    datetime.now(timezone.utc).isoformat(),
-                    datetime.now(timezone.utc).isoformat(),
+                    utc_now_iso(),
+                    utc_now_iso(),
                     "agent",
                     json.dumps([]),
                     json.dumps([]),
@@ -2691,7 +2831,6 @@ class CLI:
     def _handle_pattern_circular(self, request) -> dict[str, Any]:
         """Handle solid.pattern.circular request - create circular pattern around axis."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import pattern_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2785,8 +2924,8 @@ class CLI:
                     entity_id,
                     "solid",
                     workspace_id,
-                    datetime.now(timezone.utc).isoformat(),
-                    datetime.now(timezone.utc).isoformat(),
+                    utc_now_iso(),
+                    utc_now_iso(),
                     "agent",
                     json.dumps([]),
                     json.dumps([]),
@@ -2847,7 +2986,6 @@ class CLI:
     def _handle_solid_mirror(self, request) -> dict[str, Any]:
         """Handle solid.mirror request - create mirrored copy across plane."""
         import json
-        from datetime import datetime, timezone
         from ..cad_kernel import pattern_ops
         from ..cad_kernel.exceptions import InvalidGeometryError, OperationFailedError
 
@@ -2934,8 +3072,8 @@ class CLI:
                 entity_id,
                 "solid",
                 workspace_id,
-                datetime.now(timezone.utc).isoformat(),
-                datetime.now(timezone.utc).isoformat(),
+                utc_now_iso(),
+                utc_now_iso(),
                 "agent",
                 json.dumps([]),
                 json.dumps([]),
@@ -3009,17 +3147,131 @@ class CLI:
             raise ValueError(str(e))
 
 
+_FRAME_HEADER = struct.Struct('<I')
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from sock, or b'' if the peer closed first."""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            return b""
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _truncate_wal(workspace_dir: Optional[str]) -> None:
+    """Run a TRUNCATE checkpoint on a workspace database, if it exists."""
+    db_path = Path(workspace_dir or "data/workspaces/main") / "database.db"
+    if not db_path.exists():
+        return
+
+    database = Database(db_path)
+    try:
+        database.checkpoint("TRUNCATE")
+    except sqlite3.Error:
+        # Another process holds the lock; wal_autocheckpoint still bounds the WAL
+        pass
+    finally:
+        database.close()
+
+
+def _handle_request(request_json: str, workspace_dir: Optional[str] = None) -> str:
+    """Process one JSON-RPC request with a freshly initialized CLI."""
+    cli = CLI(workspace_dir=workspace_dir) if workspace_dir else CLI()
+    try:
+        return cli.process_request(request_json)
+    finally:
+        cli.close()
+
+
+def dispatch(method: str, params: dict, workspace_dir: Optional[str] = None) -> dict:
+    """Execute one JSON-RPC method in the calling process.
+
+    Lets in-process callers (e.g. the multi-agent controller) skip the
+    worker round-trip while getting exactly the response a CLI subprocess
+    would return.
+
+    Args:
+        method: JSON-RPC method name (e.g., "entity.create.point")
+        params: Method parameters
+        workspace_dir: Directory for workspace data (default if None)
+
+    Returns:
+        Parsed JSON-RPC response object (with "result" or "error")
+    """
+    import json
+
+    request_json = json.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": 1})
+    return json.loads(_handle_request(request_json, workspace_dir))
+
+
+def serve(workspace_dir: Optional[str] = None, socket_fd: Optional[int] = None) -> None:
+    """Serve JSON-RPC requests as a long-lived worker process.
+
+    Each request gets a freshly initialized CLI, so results match a
+    one-shot CLI invocation while interpreter startup and module imports
+    are paid only once per worker.
+
+    Requests are read as NDJSON lines from stdin, with one response line
+    written and flushed per request. When socket_fd is given, requests and
+    responses are instead exchanged over that inherited Unix domain socket,
+    each framed by a 4-byte little-endian length prefix.
+
+    Args:
+        workspace_dir: Directory for workspace data (default if None)
+        socket_fd: File descriptor of a connected socket to serve on
+    """
+    try:
+        if socket_fd is not None:
+            with socket.socket(fileno=socket_fd) as sock:
+                while True:
+                    header = _recv_exact(sock, _FRAME_HEADER.size)
+                    if not header:
+                        return
+                    (length,) = _FRAME_HEADER.unpack(header)
+                    request = _recv_exact(sock, length)
+                    if len(request) != length:
+                        return
+
+                    response = _handle_request(request.decode('utf-8'), workspace_dir).encode('utf-8')
+                    sock.sendall(_FRAME_HEADER.pack(len(response)) + response)
+
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+
+            response = _handle_request(line, workspace_dir)
+            sys.stdout.write(response)
+            sys.stdout.flush()
+    finally:
+        # Worker is idle for good: fold the WAL back into the database file
+        _truncate_wal(workspace_dir)
+
+
 def main():
     """Main entry point for CLI application.
 
-    Supports two modes:
+    Supports three modes:
     1. JSON-RPC mode (no args): Reads JSON-RPC requests from stdin
-    2. Command-line mode (with args): Processes single command from argv
+    2. Worker mode (--serve): Like JSON-RPC mode, with fresh CLI state per request
+    3. Command-line mode (with args): Processes single command from argv
     """
     import argparse
     import json
     import os
 
+    # Persistent worker mode: serve requests from stdin (or an inherited
+    # socket passed as "--serve --socket-fd N") until EOF
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        socket_fd = None
+        if len(sys.argv) > 3 and sys.argv[2] == "--socket-fd":
+            socket_fd = int(sys.argv[3])
+        serve(os.environ.get("MULTI_AGENT_WORKSPACE_DIR"), socket_fd)
+        return
+
     # Read workspace directory from environment variable if set
     workspace_dir = os.environ.get("MULTI_AGENT_WORKSPACE_DIR", "data/workspaces/main")
     cli = CLI(workspace_dir=workspace_dir)
@@ -3081,7 +3333,7 @@ def main():
             print(response, end='')
         finally:
             # Ensure database connection is properly closed
-            cli.database.close()
+            cli.close()
     else:
         # JSON-RPC mode: read from stdin
         # Check environment variable for workspace_dir in JSON-RPC mode
@@ -3093,7 +3345,8 @@ def main():
             cli.run()
         finally:
             # Ensure database connection is properly closed
-            cli.database.close()
+            cli.close()
+            _truncate_wal(workspace_dir)
 
 
 if __name__ == "__main__":
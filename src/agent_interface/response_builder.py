@@ -2,6 +2,9 @@
 import json
 from typing import Any, Optional
 
+# Responses are machine-read; skip the whitespace json.dumps adds by default
+_SEPARATORS = (",", ":")
+
 
 class ResponseBuilder:
     """Build JSON-RPC 2.0 responses."""
@@ -40,7 +43,7 @@ class ResponseBuilder:
             "result": result
         }
 
-        return json.dumps(response)
+        return json.dumps(response, separators=_SEPARATORS)
 
     def error(
         self,
@@ -74,7 +77,7 @@ class ResponseBuilder:
             "error": error_obj
         }
 
-        return json.dumps(response)
+        return json.dumps(response, separators=_SEPARATORS)
 
     def progress(
         self,
@@ -109,7 +112,7 @@ class ResponseBuilder:
             "result": result
         }
 
-        return json.dumps(response)
+        return json.dumps(response, separators=_SEPARATORS)
 
     def format_ndjson(self, response: str) -> str:
         """Format response as NDJSON (newline-delimited JSON).
@@ -1,9 +1,12 @@
 """Entity management and base classes for geometric entities."""
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from src.utils.timestamps import utc_now_iso
+
 
 @dataclass
 class GeometricEntity:
@@ -51,6 +54,25 @@ class GeometricEntity:
         unique_id = uuid.uuid4().hex[:8]
         return f"{workspace_id}:{entity_type}_{unique_id}"
 
+    @classmethod
+    def generate_entity_ids(cls, workspace_id: str, entity_type: str, count: int) -> list[str]:
+        """Generate a batch of unique entity IDs.
+
+        Reads the random suffixes for the whole batch in one os.urandom call
+        instead of building a UUID per entity.
+
+        Args:
+            workspace_id: Workspace identifier
+            entity_type: Type of entity
+            count: Number of IDs to generate
+
+        Returns:
+            List of formatted entity IDs (workspace:type_hex)
+        """
+        suffixes = os.urandom(4 * count).hex()
+        prefix = f"{workspace_id}:{entity_type}_"
+        return [prefix + suffixes[i:i + 8] for i in range(0, 8 * count, 8)]
+
     @classmethod
     def get_current_timestamp(cls) -> str:
         """Get current timestamp in ISO 8601 format with UTC timezone.
@@ -173,6 +195,58 @@ class EntityManager:
 
         return entity
 
+    def create_entities(
+        self,
+        entity_type: str,
+        workspace_id: str,
+        agent_id: str,
+        geometry: list[tuple[dict[str, Any], dict[str, list[float]]]]
+    ) -> list[GeometricEntity]:
+        """Create and persist several entities of one type in one transaction.
+
+        Args:
+            entity_type: Type of entities to create
+            workspace_id: Workspace identifier
+            agent_id: Agent creating these entities
+            geometry: (properties, bounding_box) pair for each entity
+
+        Returns:
+            Created GeometricEntity instances, in input order
+        """
+        now = utc_now_iso()
+        entity_ids = GeometricEntity.generate_entity_ids(workspace_id, entity_type, len(geometry))
+        entities = [
+            GeometricEntity(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                workspace_id=workspace_id,
+                created_at=now,
+                modified_at=now,
+                created_by_agent=agent_id,
+                properties=properties,
+                bounding_box=bounding_box
+            )
+            for entity_id, (properties, bounding_box) in zip(entity_ids, geometry)
+        ]
+
+        # Persist all rows with one executemany and one count update
+        self.entity_store.create_entities_bulk(
+            (
+                entity.entity_id,
+                entity.entity_type,
+                entity.workspace_id,
+                entity.created_by_agent,
+                entity.properties,
+                entity.bounding_box,
+                entity.parent_entities,
+                entity.is_valid,
+                entity.validation_errors
+            )
+            for entity in entities
+        )
+
+        return entities
+
     def get_entity(self, entity_id: str) -> Optional[GeometricEntity]:
         """Retrieve entity by ID.
 
@@ -100,7 +100,8 @@ class GeometryCore:
         if len(start) != len(end):
             return False, "Start and end points must have same dimension"
 
-        distance = self.calculate_distance(start, end)
+        # Dimensions already match, so skip calculate_distance's re-check
+        distance = math.dist(start, end)
         if distance < self._tolerance:
             return False, f"Line is degenerate (length {distance} < tolerance {self._tolerance})"
 
@@ -150,8 +151,7 @@ class GeometryCore:
         if len(point1) != len(point2):
             raise ValueError("Points must have same dimension")
 
-        sum_squares = sum((p1 - p2) ** 2 for p1, p2 in zip(point1, point2))
-        return math.sqrt(sum_squares)
+        return math.dist(point1, point2)
 
     def calculate_direction_vector(
         self,
@@ -158,8 +158,6 @@ class GeometryShape:
         try:
             import tempfile
             import os
-            from OCC.Core.BRepTools import breptools_Read
-            from OCC.Core.TopoDS import TopoDS_Shape as TopoDS_Shape_Constructor
 
             # Use temporary file for deserialization
             with tempfile.NamedTemporaryFile(mode='w', suffix='.brep', delete=False) as tmp:
@@ -168,10 +166,7 @@ class GeometryShape:
 
             try:
                 # Read shape from temporary file
-                reconstructed_shape = TopoDS_Shape_Constructor()
-                from OCC.Core.BRep import BRep_Builder
-                builder = BRep_Builder()
-                breptools_Read(reconstructed_shape, tmp_path, builder)
+                reconstructed_shape = self.read_brep_file(tmp_path)
 
                 # Cache for future use
                 self._cached_shape = reconstructed_shape
@@ -186,6 +181,24 @@ class GeometryShape:
                 f"Failed to deserialize BRep data for shape {self.shape_id}: {e}"
             )
 
+    @staticmethod
+    def read_brep_file(file_path: str) -> TopoDS_Shape:
+        """Read a TopoDS_Shape from a BRep file.
+
+        Args:
+            file_path: Path to BRep file
+
+        Returns:
+            TopoDS_Shape read from the file
+        """
+        from OCC.Core.BRepTools import breptools_Read
+        from OCC.Core.BRep import BRep_Builder
+
+        shape = TopoDS_Shape()
+        builder = BRep_Builder()
+        breptools_Read(shape, file_path, builder)
+        return shape
+
     def validate(self) -> bool:
         """Validate shape topology using BRepCheck_Analyzer.
 
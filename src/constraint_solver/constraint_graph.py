@@ -6,6 +6,8 @@ enabling constraint solving and conflict detection.
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from ..operations.constraints import evaluate_constraints
+
 
 @dataclass
 class ConstraintGraph:
@@ -128,11 +130,13 @@ class ConstraintGraph:
 
         return False
 
-    def update_constraint_status(self) -> None:
-        """Update satisfaction status for all constraints."""
-        for constraint in self.constraints.values():
-            is_satisfied, _ = constraint.check_satisfaction()
-            constraint.satisfaction_status = "satisfied" if is_satisfied else "violated"
+    def update_constraint_status(self) -> list[float]:
+        """Update satisfaction status for all constraints.
+
+        Returns:
+            Error magnitude of each constraint, in insertion order
+        """
+        return evaluate_constraints(self.constraints.values())
 
     def count_degrees_of_freedom(self) -> dict[str, int]:
         """Count degrees of freedom in the system.
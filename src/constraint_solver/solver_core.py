@@ -35,12 +35,12 @@ class ConstraintSolver:
         # For now, just check if existing constraints are satisfied
         # A real solver would adjust entity positions to satisfy constraints
 
-        constraint_graph.update_constraint_status()
+        # One evaluation per constraint yields both status and residual
+        residuals = constraint_graph.update_constraint_status()
 
         # Compute total residual
         total_residual = 0.0
-        for constraint in constraint_graph.constraints.values():
-            residual = constraint.compute_residual()
+        for residual in residuals:
             total_residual += residual ** 2
 
         total_residual = total_residual ** 0.5
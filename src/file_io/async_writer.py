@@ -0,0 +1,146 @@
+"""Background writer for non-critical export artifacts.
+
+JSON dumps and STL previews do not need to hit disk before the agent gets its
+response, so they can be serialized in memory and handed to a writer thread.
+Integrity-critical exports (STEP) stay synchronous and never use this path.
+
+One writer is shared by the whole process (see get_artifact_writer), so it
+outlives the per-request CLI instances of a serving worker. Write failures
+are reported by the next flush.
+"""
+import atexit
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class AsyncArtifactWriter:
+    """Write artifact bytes to disk on a daemon thread.
+
+    Writes are enqueued as (path, data) pairs on a bounded queue; when the
+    queue is full, ``submit`` blocks until the writer catches up. Call
+    ``flush()`` on shutdown to make sure every enqueued artifact is on disk.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        """Initialize writer and start the background thread.
+
+        Args:
+            max_pending: Maximum number of queued writes before submit blocks
+        """
+        self._queue: "queue.Queue[Optional[Tuple[Path, bytes]]]" = queue.Queue(maxsize=max_pending)
+        self._errors: List[str] = []
+        self._errors_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="artifact-writer",
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, path: Path, data: bytes) -> int:
+        """Enqueue bytes to be written to path.
+
+        Args:
+            path: Output file path
+            data: Complete file contents
+
+        Returns:
+            Number of bytes enqueued
+
+        Raises:
+            RuntimeError: If writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError("AsyncArtifactWriter is closed")
+
+        self._queue.put((Path(path), data))
+        return len(data)
+
+    def flush(self) -> None:
+        """Block until all enqueued artifacts have been written.
+
+        Raises:
+            RuntimeError: If any background write failed since the last flush
+        """
+        self._queue.join()
+
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise RuntimeError(f"Failed to write {len(errors)} artifact(s): {'; '.join(errors)}")
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background thread."""
+        if self._closed:
+            return
+
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                path, data = item
+                try:
+                    path.write_bytes(data)
+                except OSError as e:
+                    with self._errors_lock:
+                        self._errors.append(f"{path}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+_shared_writer: Optional[AsyncArtifactWriter] = None
+_shared_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> AsyncArtifactWriter:
+    """Get or create the process-wide artifact writer.
+
+    The writer thread starts on first use, and pending writes are flushed
+    when the interpreter exits.
+
+    Returns:
+        Shared AsyncArtifactWriter instance
+    """
+    global _shared_writer
+    with _shared_writer_lock:
+        if _shared_writer is None:
+            _shared_writer = AsyncArtifactWriter()
+            atexit.register(_close_shared_writer)
+    return _shared_writer
+
+
+def flush_artifact_writes() -> None:
+    """Block until every queued artifact write has finished.
+
+    Does nothing if no artifact has been queued in this process.
+
+    Raises:
+        RuntimeError: If any background write failed since the last flush
+    """
+    if _shared_writer is not None:
+        _shared_writer.flush()
+
+
+def _close_shared_writer() -> None:
+    """Flush and stop the shared writer at interpreter exit."""
+    try:
+        _shared_writer.close()
+    except RuntimeError as e:
+        # No request is left to report this to
+        print(f"Artifact writer: {e}", file=sys.stderr)
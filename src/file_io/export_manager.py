@@ -3,15 +3,22 @@
 Coordinates STEP and STL exports by retrieving geometry from database
 and routing to appropriate format handlers.
 """
+import hashlib
+import json
+import os
+import shutil
+import tempfile
 import time
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
 from OCC.Core.TopoDS import TopoDS_Shape
 
 # Import format handlers
-from .step_handler import export_step
-from .stl_handler import export_stl
+from .async_writer import AsyncArtifactWriter
+from .step_handler import export_step, step_output_path
+from .stl_handler import export_stl, stl_output_path
 
 
 class ExportManager:
@@ -19,13 +26,72 @@ class ExportManager:
 
     SUPPORTED_FORMATS = ["step", "stl"]
 
-    def __init__(self, database_connection):
+    # SQL kept as constants so every call reuses the identical string and
+    # hits the connection's prepared-statement cache
+    # Returns the shape rowid rather than brep_data so the blob can be
+    # streamed with Connection.blobopen instead of materialized in Python
+    _SQL_ENTITY_SHAPE = """
+        SELECT g.shape_id, g.rowid
+        FROM entities e
+        JOIN geometry_shapes g ON g.shape_id = e.shape_id
+        WHERE e.entity_id = ? AND e.workspace_id = ?
+    """
+
+    # Entity IDs are bound as one JSON array so the statement text stays
+    # constant regardless of how many entities are exported
+    _SQL_ENTITY_SHAPE_STAMPS = """
+        SELECT g.shape_id, g.created_at
+        FROM entities e
+        JOIN geometry_shapes g ON g.shape_id = e.shape_id
+        WHERE e.workspace_id = ? AND e.entity_id IN (SELECT value FROM json_each(?))
+    """
+
+    _SQL_WORKSPACE_SOLIDS_FIRST = """
+        SELECT entity_id, created_at FROM entities
+        WHERE workspace_id = ? AND shape_id IS NOT NULL
+        ORDER BY created_at, entity_id
+        LIMIT ?
+    """
+
+    _SQL_WORKSPACE_SOLIDS_NEXT = """
+        SELECT entity_id, created_at FROM entities
+        WHERE workspace_id = ? AND shape_id IS NOT NULL
+          AND (created_at, entity_id) > (?, ?)
+        ORDER BY created_at, entity_id
+        LIMIT ?
+    """
+
+    # Chunk size for streaming brep_data blobs to the BRep reader
+    BLOB_CHUNK_SIZE = 1 << 20
+
+    # Entity IDs fetched per keyset page when exporting a whole workspace
+    WORKSPACE_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        database_connection,
+        async_writer: Optional[AsyncArtifactWriter] = None,
+        cache_dir: Optional[str | Path] = None
+    ):
         """Initialize export manager.
 
         Args:
             database_connection: Database connection for retrieving geometry
+            async_writer: Optional background writer for non-critical artifacts
+                (binary STL). STEP exports are always written synchronously.
+            cache_dir: Optional directory for cached export outputs, keyed by
+                shape IDs and export options. Re-exports of unchanged shapes
+                are copied from here.
         """
         self.db = database_connection
+        self.async_writer = async_writer
+
+        # Read-side tuning for blob-heavy exports. Exports never commit, so
+        # synchronous (write durability) is left at the connection's default.
+        self.db.execute("PRAGMA temp_store = MEMORY")  # Keep sort/temp tables off disk
+        self.db.execute("PRAGMA mmap_size = 268435456")  # Read large brep_data blobs via page cache
+        self.db.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def export_entities(
         self,
@@ -54,32 +120,41 @@ class ExportManager:
             RuntimeError: If export fails
         """
         start_time = time.time()
-
-        # Validate format
-        format_lower = format.lower()
-        if format_lower not in self.SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported export format: {format}. "
-                f"Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+        format_lower = self._validate_format(format)
+
+        # Serve unchanged exports from the export cache without reading BRep
+        # blobs or invoking OCCT
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path, cached_report = self._lookup_export_cache(
+                entity_ids, workspace_id, format_lower, format_options
             )
 
+            if cached_report is not None:
+                output_path = self._output_path(format_lower, file_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.unlink(missing_ok=True)
+                shutil.copyfile(cache_path, output_path)
+
+                result = dict(cached_report)
+                result["file_path"] = str(output_path.absolute())
+                result["cache_hit"] = True
+                result["execution_time_ms"] = int((time.time() - start_time) * 1000)
+                return result
+
         # Retrieve geometry shapes from database
         shapes = self._get_shapes_for_entities(entity_ids, workspace_id)
 
         if not shapes:
             raise ValueError(f"No valid geometry found for entities: {entity_ids}")
 
-        # Route to appropriate format handler
-        if format_lower == "step":
-            result = self._export_step(shapes, file_path, **format_options)
-        elif format_lower == "stl":
-            result = self._export_stl(shapes, file_path, **format_options)
-        else:
-            raise ValueError(f"Format handler not implemented: {format}")
+        result = self._export_shapes(shapes, file_path, format_lower, start_time, **format_options)
 
-        # Add execution time
-        execution_time_ms = int((time.time() - start_time) * 1000)
-        result["execution_time_ms"] = execution_time_ms
+        if cache_path is not None:
+            # Background STL writes may not be on disk yet, so they are not cached
+            if not (format_lower == "stl" and self.async_writer is not None):
+                self._store_in_cache(Path(result["file_path"]), cache_path, result)
+            result["cache_hit"] = False
 
         return result
 
@@ -105,19 +180,188 @@ class ExportManager:
             ValueError: If workspace has no solids
             RuntimeError: If export fails
         """
-        # Get all solid entity IDs in workspace
-        entity_ids = self._get_workspace_solids(workspace_id)
+        start_time = time.time()
+        format_lower = self._validate_format(format)
+
+        # Stream entity IDs in key-ordered batches and load each batch's
+        # shapes before fetching the next page
+        entity_ids: List[str] = []
+        shapes: List[TopoDS_Shape] = []
+        for batch in self._iter_workspace_solids(workspace_id, self.WORKSPACE_BATCH_SIZE):
+            entity_ids.extend(batch)
+            shapes.extend(self._get_shapes_for_entities(batch, workspace_id))
 
         if not entity_ids:
             raise ValueError(f"No solids found in workspace: {workspace_id}")
 
-        return self.export_entities(
-            entity_ids=entity_ids,
-            file_path=file_path,
-            format=format,
-            workspace_id=workspace_id,
-            **format_options
-        )
+        if not shapes:
+            raise ValueError(f"No valid geometry found for entities: {entity_ids}")
+
+        return self._export_shapes(shapes, file_path, format_lower, start_time, **format_options)
+
+    def _validate_format(self, format: str) -> str:
+        """Normalize and validate export format.
+
+        Args:
+            format: Export format (step, stl)
+
+        Returns:
+            Lowercase format name
+
+        Raises:
+            ValueError: If format not supported
+        """
+        format_lower = format.lower()
+        if format_lower not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported export format: {format}. "
+                f"Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+        return format_lower
+
+    def _export_shapes(
+        self,
+        shapes: List[TopoDS_Shape],
+        file_path: str,
+        format_lower: str,
+        start_time: float,
+        **format_options
+    ) -> Dict[str, Any]:
+        """Route loaded shapes to the format handler and time the export.
+
+        Args:
+            shapes: Shapes to export
+            file_path: Output file path
+            format_lower: Validated lowercase format name
+            start_time: time.time() when the export request started
+            **format_options: Format-specific options
+
+        Returns:
+            Export report dictionary
+        """
+        # Route to appropriate format handler
+        if format_lower == "step":
+            result = self._export_step(shapes, file_path, **format_options)
+        elif format_lower == "stl":
+            result = self._export_stl(shapes, file_path, **format_options)
+        else:
+            raise ValueError(f"Format handler not implemented: {format_lower}")
+
+        # Add execution time
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        result["execution_time_ms"] = execution_time_ms
+
+        return result
+
+    def _lookup_export_cache(
+        self,
+        entity_ids: List[str],
+        workspace_id: str,
+        format_lower: str,
+        format_options: Dict[str, Any]
+    ) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """Find a cached export for the entities' current shapes.
+
+        The cache key hashes the sorted shape IDs with the format and its
+        effective options. An entry is fresh only if it was written after
+        every shape was created and still has the size recorded in its
+        report. Only one query runs and no blobs are read.
+
+        Args:
+            entity_ids: Entity IDs to export
+            workspace_id: Workspace containing entities
+            format_lower: Validated lowercase format name
+            format_options: Format-specific options
+
+        Returns:
+            Tuple of (cache path or None if no geometry, cached report or
+            None on a miss)
+        """
+        cursor = self.db.cursor()
+        cursor.execute(self._SQL_ENTITY_SHAPE_STAMPS, (workspace_id, json.dumps(entity_ids)))
+        stamps = cursor.fetchall()
+
+        if not stamps:
+            return None, None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("|".join(sorted(row[0] for row in stamps)).encode())
+        digest.update(json.dumps(
+            [format_lower, self._cache_options(format_lower, format_options)]
+        ).encode())
+        cache_path = self.cache_dir / f"{digest.hexdigest()}.{format_lower}"
+
+        try:
+            cached_stat = cache_path.stat()
+            cached_report = json.loads(cache_path.with_suffix(".json").read_text())
+        except (OSError, ValueError):
+            return cache_path, None
+
+        newest_shape = max(_iso_to_epoch(row[1]) for row in stamps)
+        if (cached_stat.st_mtime <= newest_shape
+                or cached_stat.st_size != cached_report.get("file_size")):
+            return cache_path, None
+
+        return cache_path, cached_report
+
+    @staticmethod
+    def _cache_options(format_lower: str, format_options: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve the options that affect export output, applying defaults.
+
+        Args:
+            format_lower: Validated lowercase format name
+            format_options: Format-specific options
+
+        Returns:
+            Effective options for the cache key
+        """
+        if format_lower == "step":
+            return {"schema": format_options.get("schema", "AP214")}
+
+        return {
+            "tessellation_quality": format_options.get("tessellation_quality", "standard"),
+            "ascii": bool(format_options.get("ascii", False))
+        }
+
+    @staticmethod
+    def _output_path(format_lower: str, file_path: str) -> Path:
+        """Resolve the output path the format handler would write to.
+
+        Args:
+            format_lower: Validated lowercase format name
+            file_path: Requested output file path
+
+        Returns:
+            Output path with the format's extension
+        """
+        if format_lower == "step":
+            return step_output_path(file_path)
+        return stl_output_path(file_path)
+
+    def _store_in_cache(self, output_path: Path, cache_path: Path, report: Dict[str, Any]) -> None:
+        """Record a freshly written export in the cache (best effort).
+
+        Args:
+            output_path: Written export file
+            cache_path: Cache entry to populate
+            report: Export report to replay on cache hits
+        """
+        cached_report = {
+            key: value for key, value in report.items()
+            if key not in ("file_path", "execution_time_ms", "cache_hit")
+        }
+        report_path = cache_path.with_suffix(".json")
+        staging_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path.unlink(missing_ok=True)
+            shutil.copyfile(output_path, staging_path)
+            os.replace(staging_path, cache_path)
+
+            staging_path.write_text(json.dumps(cached_report))
+            os.replace(staging_path, report_path)
+        except OSError:
+            staging_path.unlink(missing_ok=True)
 
     def _get_shapes_for_entities(
         self,
@@ -133,51 +377,22 @@ class ExportManager:
         Returns:
             List of TopoDS_Shape objects
         """
-        from ..cad_kernel.geometry_engine import GeometryShape
-
         shapes = []
         cursor = self.db.cursor()
 
         for entity_id in entity_ids:
-            # Get shape_id from entity
-            cursor.execute(
-                "SELECT shape_id FROM entities WHERE entity_id = ? AND workspace_id = ?",
-                (entity_id, workspace_id)
-            )
-            row = cursor.fetchone()
-
-            if not row or not row[0]:
-                continue  # Skip entities without geometry
-
-            shape_id = row[0]
-
-            # Get geometry shape from database
-            cursor.execute(
-                """
-                SELECT shape_id, shape_type, brep_data, is_valid, created_at, workspace_id
-                FROM geometry_shapes
-                WHERE shape_id = ?
-                """,
-                (shape_id,)
-            )
+            # Resolve entity -> geometry shape in a single statement
+            cursor.execute(self._SQL_ENTITY_SHAPE, (entity_id, workspace_id))
             shape_row = cursor.fetchone()
 
             if not shape_row:
-                continue
+                continue  # Skip entities without geometry
 
-            # Reconstruct GeometryShape
-            geo_shape = GeometryShape(
-                shape_id=shape_row[0],
-                shape_type=shape_row[1],
-                brep_data=shape_row[2],
-                is_valid=bool(shape_row[3]),
-                created_at=shape_row[4],
-                workspace_id=shape_row[5]
-            )
+            shape_id, rowid = shape_row[0], shape_row[1]
 
             # Deserialize to TopoDS_Shape
             try:
-                shape = geo_shape.to_shape()
+                shape = self._read_shape_blob(rowid)
                 shapes.append(shape)
             except Exception as e:
                 # Log error but continue with other shapes
@@ -186,6 +401,32 @@ class ExportManager:
 
         return shapes
 
+    def _read_shape_blob(self, rowid: int) -> TopoDS_Shape:
+        """Stream a stored BRep blob to the OCCT reader.
+
+        The blob is copied in chunks from SQLite's incremental blob I/O into
+        the temporary file OCCT reads from, so the full BRep text is never
+        held in Python memory.
+
+        Args:
+            rowid: Row ID of the geometry_shapes record
+
+        Returns:
+            Deserialized TopoDS_Shape
+        """
+        from ..cad_kernel.geometry_engine import GeometryShape
+
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.brep', delete=False) as tmp:
+            tmp_path = tmp.name
+            with self.db.blobopen("geometry_shapes", "brep_data", rowid, readonly=True) as blob:
+                while chunk := blob.read(self.BLOB_CHUNK_SIZE):
+                    tmp.write(chunk)
+
+        try:
+            return GeometryShape.read_brep_file(tmp_path)
+        finally:
+            os.remove(tmp_path)
+
     def _get_workspace_solids(self, workspace_id: str) -> List[str]:
         """Get all solid entity IDs in workspace.
 
@@ -195,16 +436,45 @@ class ExportManager:
         Returns:
             List of entity IDs with geometry
         """
+        entity_ids: List[str] = []
+        for batch in self._iter_workspace_solids(workspace_id):
+            entity_ids.extend(batch)
+        return entity_ids
+
+    def _iter_workspace_solids(
+        self,
+        workspace_id: str,
+        batch_size: int = 1000
+    ) -> Iterator[List[str]]:
+        """Yield solid entity IDs in workspace in creation-ordered batches.
+
+        Uses keyset pagination on (created_at, entity_id) so each batch is an
+        index range scan and very large workspaces are never materialized at
+        once.
+
+        Args:
+            workspace_id: Workspace ID
+            batch_size: Maximum entity IDs per batch
+
+        Yields:
+            Lists of entity IDs with geometry
+        """
         cursor = self.db.cursor()
-        cursor.execute(
-            """
-            SELECT entity_id FROM entities
-            WHERE workspace_id = ? AND shape_id IS NOT NULL
-            ORDER BY created_at
-            """,
-            (workspace_id,)
-        )
-        return [row[0] for row in cursor.fetchall()]
+        cursor.execute(self._SQL_WORKSPACE_SOLIDS_FIRST, (workspace_id, batch_size))
+        rows = cursor.fetchall()
+
+        while rows:
+            yield [row[0] for row in rows]
+
+            if len(rows) < batch_size:
+                return
+
+            last_entity_id, last_created_at = rows[-1][0], rows[-1][1]
+            cursor.execute(
+                self._SQL_WORKSPACE_SOLIDS_NEXT,
+                (workspace_id, last_created_at, last_entity_id, batch_size)
+            )
+            rows = cursor.fetchall()
 
     def _export_step(
         self,
@@ -246,5 +516,25 @@ class ExportManager:
             shapes,
             file_path,
             tessellation_quality=tessellation_quality,
-            ascii_format=ascii
+            ascii_format=ascii,
+            async_writer=self.async_writer
         )
+
+
+def _iso_to_epoch(value: str) -> float:
+    """Convert an ISO timestamp to epoch seconds.
+
+    Args:
+        value: ISO 8601 timestamp; naive values are treated as UTC
+
+    Returns:
+        Epoch seconds, or +inf if unparseable (forces a cache miss)
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return float("inf")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
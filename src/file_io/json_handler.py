@@ -4,15 +4,23 @@ JSON is a simple interchange format that preserves all entity properties.
 """
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+from .async_writer import AsyncArtifactWriter
 
-def export_json(entities: list[dict[str, Any]], file_path: str) -> dict[str, Any]:
+
+def export_json(
+    entities: list[dict[str, Any]],
+    file_path: str,
+    async_writer: Optional[AsyncArtifactWriter] = None
+) -> dict[str, Any]:
     """Export entities to JSON format.
 
     Args:
         entities: List of entity dictionaries
         file_path: Output file path
+        async_writer: If provided, serialize in memory and enqueue the write
+            instead of blocking on disk I/O
 
     Returns:
         Export report with statistics
@@ -27,11 +35,17 @@ def export_json(entities: list[dict[str, Any]], file_path: str) -> dict[str, Any
         "entities": entities
     }
 
+    # Serialize once; the byte count doubles as the reported file size
+    data = json.dumps(export_data, indent=2).encode('utf-8')
+
     # Write to file
-    with open(output_path, 'w') as f:
-        json.dump(export_data, f, indent=2)
+    if async_writer is not None:
+        file_size = async_writer.submit(output_path, data)
+    else:
+        with open(output_path, 'wb') as f:
+            f.write(data)
 
-    file_size = output_path.stat().st_size
+        file_size = len(data)
 
     return {
         "file_path": str(output_path),
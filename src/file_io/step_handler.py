@@ -5,14 +5,19 @@ for representing and exchanging product manufacturing information. It preserves
 exact geometry unlike mesh formats (STL, OBJ).
 """
 from pathlib import Path
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 
-from OCC.Core.TopoDS import TopoDS_Shape
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
 from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.Interface import Interface_Static
 
 
+# Schema currently set in OCCT's global Interface_Static registry
+_configured_schema: Optional[str] = None
+
+
 def export_step(
     shapes: List[TopoDS_Shape],
     file_path: str,
@@ -34,41 +39,30 @@ def export_step(
     Raises:
         RuntimeError: If STEP export fails
     """
-    output_path = Path(file_path)
+    output_path = step_output_path(file_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Ensure proper extension
-    if output_path.suffix.lower() not in ['.step', '.stp']:
-        output_path = output_path.with_suffix('.step')
-
     # Initialize STEP writer
     writer = STEPControl_Writer()
 
-    # Set STEP schema (AP203, AP214, AP242)
-    # AP214: Automotive design (most common)
-    # AP203: Configuration controlled 3D design
-    # AP242: Managed model based 3D engineering (latest)
-    Interface_Static.SetCVal("write.step.schema", schema)
-
-    # Set unit to millimeters
-    Interface_Static.SetCVal("write.step.unit", "MM")
-
-    # Set product name
-    Interface_Static.SetCVal("write.step.product.name", "CAD_Export")
-
-    # Transfer shapes to STEP writer
-    shape_count = 0
-    for shape in shapes:
-        # Transfer shape (keep topology as-is)
-        status = writer.Transfer(shape, STEPControl_AsIs)
-        if status == IFSelect_RetDone:
-            shape_count += 1
-        else:
-            raise RuntimeError(f"Failed to transfer shape {shape_count + 1} to STEP writer")
+    # Configure global STEP writer parameters (only touched when they change)
+    _configure_step_defaults(schema)
 
+    # Transfer shapes to STEP writer. Multiple shapes are gathered into one
+    # compound so the writer runs a single transfer (one schema/model setup)
+    # instead of one per shape.
+    shape_count = len(shapes)
     if shape_count == 0:
         raise RuntimeError("No shapes were successfully transferred to STEP writer")
 
+    status = writer.Transfer(_as_single_shape(shapes), STEPControl_AsIs)
+    if status != IFSelect_RetDone:
+        raise RuntimeError(f"Failed to transfer {shape_count} shape(s) to STEP writer")
+
+    # Replace rather than truncate an existing file: exports written by
+    # older versions may still be hardlinked into the export cache
+    output_path.unlink(missing_ok=True)
+
     # Write STEP file
     write_status = writer.Write(str(output_path))
 
@@ -78,6 +72,41 @@ def export_step(
     # Get file statistics
     file_size = output_path.stat().st_size
 
+    return build_step_report(output_path, schema, shape_count, file_size)
+
+
+def step_output_path(file_path: str) -> Path:
+    """Resolve the STEP output path, ensuring a .step/.stp extension.
+
+    Args:
+        file_path: Requested output file path
+
+    Returns:
+        Output path with a STEP extension
+    """
+    output_path = Path(file_path)
+    if output_path.suffix.lower() not in ['.step', '.stp']:
+        output_path = output_path.with_suffix('.step')
+    return output_path
+
+
+def build_step_report(
+    output_path: Path,
+    schema: str,
+    shape_count: int,
+    file_size: int
+) -> Dict[str, Any]:
+    """Build the export report for a written STEP file.
+
+    Args:
+        output_path: Written STEP file
+        schema: STEP schema used
+        shape_count: Number of shapes in the file
+        file_size: File size in bytes
+
+    Returns:
+        Export report dictionary
+    """
     return {
         "file_path": str(output_path.absolute()),
         "format": "step",
@@ -93,6 +122,54 @@ def export_step(
     }
 
 
+def _configure_step_defaults(schema: str) -> None:
+    """Set STEP writer parameters in OCCT's global registry.
+
+    Unit and product name never change, so they are written once per
+    process; the schema is rewritten only when a different one is requested.
+
+    Args:
+        schema: STEP schema (AP203, AP214, AP242)
+    """
+    global _configured_schema
+
+    if _configured_schema is None:
+        # Set unit to millimeters
+        Interface_Static.SetCVal("write.step.unit", "MM")
+
+        # Set product name
+        Interface_Static.SetCVal("write.step.product.name", "CAD_Export")
+
+    if _configured_schema != schema:
+        # Set STEP schema (AP203, AP214, AP242)
+        # AP214: Automotive design (most common)
+        # AP203: Configuration controlled 3D design
+        # AP242: Managed model based 3D engineering (latest)
+        Interface_Static.SetCVal("write.step.schema", schema)
+        _configured_schema = schema
+
+
+def _as_single_shape(shapes: List[TopoDS_Shape]) -> TopoDS_Shape:
+    """Combine shapes into one compound for a single STEP transfer.
+
+    Args:
+        shapes: Non-empty list of shapes
+
+    Returns:
+        The shape itself if only one is given, otherwise a TopoDS_Compound
+    """
+    if len(shapes) == 1:
+        return shapes[0]
+
+    builder = BRep_Builder()
+    compound = TopoDS_Compound()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+
+    return compound
+
+
 def get_supported_schemas() -> List[str]:
     """Get list of supported STEP schemas.
 
@@ -5,10 +5,12 @@ This implementation uses Open CASCADE's tessellation engine to generate real geo
 """
 import struct
 from pathlib import Path
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 
 from OCC.Core.TopoDS import TopoDS_Shape
 
+from .async_writer import AsyncArtifactWriter
+
 # Import tessellation utilities from cad_kernel
 import sys
 from pathlib import Path as PathLib
@@ -16,11 +18,19 @@ sys.path.insert(0, str(PathLib(__file__).parent.parent))
 from cad_kernel.tessellation import MeshGenerator, TessellationConfig, Triangle
 
 
+# Binary STL layout: 80-byte header + uint32 count, then one 50-byte record
+# per triangle (normal + 3 vertices as float32, uint16 attribute)
+_STL_HEADER = "Binary STL - Generated by CAD System with Open CASCADE".encode('ascii')[:80].ljust(80, b' ')
+_STL_PREAMBLE = struct.Struct('<80sI')
+_STL_TRIANGLE = struct.Struct('<12fH')
+
+
 def export_stl(
     shapes: List[TopoDS_Shape],
     file_path: str,
     tessellation_quality: str = "standard",
-    ascii_format: bool = False
+    ascii_format: bool = False,
+    async_writer: Optional[AsyncArtifactWriter] = None
 ) -> Dict[str, Any]:
     """Export solids to STL format with real tessellation.
 
@@ -29,6 +39,8 @@ def export_stl(
         file_path: Output file path (.stl)
         tessellation_quality: Quality preset (preview, standard, high_quality)
         ascii_format: If True, write ASCII STL; otherwise binary
+        async_writer: If provided, binary STL bytes are enqueued on the
+            background writer instead of written synchronously
 
     Returns:
         Export report with statistics
@@ -37,13 +49,9 @@ def export_stl(
         ValueError: If invalid quality preset
         RuntimeError: If tessellation or file write fails
     """
-    output_path = Path(file_path)
+    output_path = stl_output_path(file_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Ensure .stl extension
-    if output_path.suffix.lower() != '.stl':
-        output_path = output_path.with_suffix('.stl')
-
     # Get tessellation config
     try:
         config = TessellationConfig.from_name(tessellation_quality)
@@ -60,13 +68,15 @@ def export_stl(
     if not all_triangles:
         raise RuntimeError("Tessellation produced no triangles - shapes may be invalid")
 
-    # Write STL file
+    # Replace rather than truncate an existing file: exports written by
+    # older versions may still be hardlinked into the export cache
+    output_path.unlink(missing_ok=True)
+
+    # Write STL file (writers return the byte count, so no stat() afterwards)
     if ascii_format:
-        _write_ascii_stl(output_path, all_triangles)
+        file_size = _write_ascii_stl(output_path, all_triangles)
     else:
-        _write_binary_stl(output_path, all_triangles)
-
-    file_size = output_path.stat().st_size
+        file_size = _write_binary_stl(output_path, all_triangles, async_writer=async_writer)
 
     return {
         "file_path": str(output_path.absolute()),
@@ -88,31 +98,58 @@ def export_stl(
     }
 
 
-def _write_ascii_stl(file_path: Path, triangles: List[Triangle]) -> None:
+def stl_output_path(file_path: str) -> Path:
+    """Resolve the STL output path, ensuring a .stl extension.
+
+    Args:
+        file_path: Requested output file path
+
+    Returns:
+        Output path with a .stl extension
+    """
+    output_path = Path(file_path)
+    if output_path.suffix.lower() != '.stl':
+        output_path = output_path.with_suffix('.stl')
+    return output_path
+
+
+def _write_ascii_stl(file_path: Path, triangles: List[Triangle]) -> int:
     """Write ASCII STL file.
 
     Args:
         file_path: Output file path
         triangles: List of Triangle objects
+
+    Returns:
+        Number of bytes written
     """
-    with open(file_path, 'w') as f:
-        f.write("solid exported\n")
+    lines = ["solid exported\n"]
 
-        for tri in triangles:
-            normal = tri.normal
-            vertices = tri.vertices
+    for tri in triangles:
+        normal = tri.normal
+        vertices = tri.vertices
 
-            f.write(f"  facet normal {normal[0]:.6e} {normal[1]:.6e} {normal[2]:.6e}\n")
-            f.write("    outer loop\n")
-            for vertex in vertices:
-                f.write(f"      vertex {vertex[0]:.6e} {vertex[1]:.6e} {vertex[2]:.6e}\n")
-            f.write("    endloop\n")
-            f.write("  endfacet\n")
+        lines.append(f"  facet normal {normal[0]:.6e} {normal[1]:.6e} {normal[2]:.6e}\n")
+        lines.append("    outer loop\n")
+        for vertex in vertices:
+            lines.append(f"      vertex {vertex[0]:.6e} {vertex[1]:.6e} {vertex[2]:.6e}\n")
+        lines.append("    endloop\n")
+        lines.append("  endfacet\n")
 
-        f.write("endsolid exported\n")
+    lines.append("endsolid exported\n")
 
+    data = "".join(lines).encode('ascii')
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+    return len(data)
 
-def _write_binary_stl(file_path: Path, triangles: List[Triangle]) -> None:
+
+def _write_binary_stl(
+    file_path: Path,
+    triangles: List[Triangle],
+    async_writer: Optional[AsyncArtifactWriter] = None
+) -> int:
     """Write binary STL file.
 
     Binary STL format (little-endian):
@@ -128,24 +165,26 @@ def _write_binary_stl(file_path: Path, triangles: List[Triangle]) -> None:
     Args:
         file_path: Output file path
         triangles: List of Triangle objects
+        async_writer: If provided, serialize to bytes and enqueue the write
+
+    Returns:
+        Number of bytes written (or enqueued)
     """
-    with open(file_path, 'wb') as f:
-        # Header (80 bytes) - include generator info
-        header_text = "Binary STL - Generated by CAD System with Open CASCADE"
-        header = header_text.encode('ascii')[:80].ljust(80, b' ')
-        f.write(header)
+    # Pre-size the whole file and pack each triangle record in one call
+    buffer = bytearray(_STL_PREAMBLE.size + _STL_TRIANGLE.size * len(triangles))
+    _STL_PREAMBLE.pack_into(buffer, 0, _STL_HEADER, len(triangles))
 
-        # Triangle count (4 bytes, unsigned int, little-endian)
-        f.write(struct.pack('<I', len(triangles)))
+    pack_triangle = _STL_TRIANGLE.pack_into
+    offset = _STL_PREAMBLE.size
+    for tri in triangles:
+        v1, v2, v3 = tri.vertices
+        pack_triangle(buffer, offset, *tri.normal, *v1, *v2, *v3, 0)
+        offset += _STL_TRIANGLE.size
 
-        # Write each triangle (50 bytes each)
-        for tri in triangles:
-            # Normal vector (3 floats, 12 bytes)
-            f.write(struct.pack('<fff', *tri.normal))
+    if async_writer is not None:
+        return async_writer.submit(file_path, bytes(buffer))
 
-            # Three vertices (9 floats, 36 bytes total)
-            for vertex in tri.vertices:
-                f.write(struct.pack('<fff', *vertex))
+    with open(file_path, 'wb') as f:
+        f.write(buffer)
 
-            # Attribute byte count (2 bytes, usually 0)
-            f.write(struct.pack('<H', 0))
+    return len(buffer)
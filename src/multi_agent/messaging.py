@@ -8,47 +8,60 @@ Implements:
 
 Constitution compliance:
 - No mocks or stubs - real message queue implementation
-- Uses real queue.Queue instances
+- Uses real collections.deque inboxes guarded by a lock
 - All message validation uses real schema checks
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 import time
 import json
 from pathlib import Path
 
 
-@dataclass
+_MESSAGE_TYPES = ("request", "response", "broadcast", "error")
+_VALID_MESSAGE_TYPES = frozenset(_MESSAGE_TYPES)
+
+
+@dataclass(slots=True)
 class AgentMessage:
     """
     Message sent between agents for coordination and feedback.
 
-    Fields match data-model.md specification.
+    Fields match data-model.md specification. When timestamp is omitted it is
+    stamped with the current time at construction.
     """
     message_id: str
     from_agent_id: str
     to_agent_id: str  # or "broadcast" for all agents
     message_type: str  # "request", "response", "broadcast", "error"
     content: Dict[str, Any]
-    timestamp: float = field(default_factory=time.time)
+    timestamp: Optional[float] = None
     read: bool = False
+    # Set by the controller on send for latency monitoring (T051)
+    _send_time: float = field(init=False, repr=False, compare=False)
+    # Set by the controller on delivery; orders an agent's inbox by arrival
+    _delivery_seq: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate message structure."""
         # Validate message_type
-        valid_types = ["request", "response", "broadcast", "error"]
-        if self.message_type not in valid_types:
+        if self.message_type not in _VALID_MESSAGE_TYPES:
             raise ValueError(
                 f"Invalid message_type '{self.message_type}'. "
-                f"Must be one of: {valid_types}"
+                f"Must be one of: {list(_MESSAGE_TYPES)}"
             )
 
         # Validate content is dict
         if not isinstance(self.content, dict):
             raise ValueError("Message content must be a dictionary")
 
-        # Validate timestamp
+        # A generated timestamp cannot be in the future; only check supplied ones
+        if self.timestamp is None:
+            self.timestamp = time.time()
+            return
+
         current_time = time.time()
         if self.timestamp > current_time + 60:  # Allow 60s clock skew
             raise ValueError(
@@ -76,10 +89,67 @@ class AgentMessage:
             to_agent_id=data["to_agent_id"],
             message_type=data["message_type"],
             content=data["content"],
-            timestamp=data.get("timestamp", time.time()),
+            timestamp=data.get("timestamp"),
             read=data.get("read", False)
         )
 
+    @classmethod
+    def from_dict_trusted(cls, data: Dict[str, Any]) -> "AgentMessage":
+        """
+        Create message from a dictionary produced by to_dict without validation.
+
+        Only for replaying messages that were validated when first created
+        (e.g. a persisted message log); untrusted input must use from_dict.
+        """
+        message = cls.__new__(cls)
+        message.message_id = data["message_id"]
+        message.from_agent_id = data["from_agent_id"]
+        message.to_agent_id = data["to_agent_id"]
+        message.message_type = data["message_type"]
+        message.content = data["content"]
+        message.timestamp = data["timestamp"]
+        message.read = data.get("read", False)
+        return message
+
+
+_SCHEMA_FILE = (
+    Path(__file__).parent.parent.parent / "specs" / "002-multi-agent-framework"
+    / "contracts" / "message_schemas.json"
+)
+
+# Required content fields per message type when the contracts file is absent
+# (from data-model.md examples)
+_BASIC_REQUIRED_FIELDS = {
+    "request": ["request_type"],
+    "response": ["status"],
+    "broadcast": ["announcement"],
+    "error": ["error_code", "error_message"],
+}
+
+
+@lru_cache(maxsize=None)
+def _required_content_fields() -> Dict[str, Tuple[Tuple[str, ...], frozenset]]:
+    """
+    Load required content fields per message type from message_schemas.json.
+
+    Read once per process; each entry holds the fields in schema order (for
+    error messages) and as a frozenset (for the membership check).
+    """
+    if _SCHEMA_FILE.exists():
+        with open(_SCHEMA_FILE, "r") as f:
+            message_schemas = json.load(f).get("message_schemas", {})
+        required = {
+            message_type: message_schemas.get(message_type, {}).get("content_schema", {}).get("required", [])
+            for message_type in _MESSAGE_TYPES
+        }
+    else:
+        required = _BASIC_REQUIRED_FIELDS
+
+    return {
+        message_type: (tuple(fields), frozenset(fields))
+        for message_type, fields in required.items()
+    }
+
 
 def validate_message_content(message_type: str, content: Dict[str, Any]) -> bool:
     """
@@ -100,72 +170,16 @@ def validate_message_content(message_type: str, content: Dict[str, Any]) -> bool
     if not isinstance(content, dict):
         raise ValueError("Content must be a dictionary")
 
-    # Load message schemas from contracts
-    contracts_dir = Path(__file__).parent.parent.parent / "specs" / "002-multi-agent-framework" / "contracts"
-    schema_file = contracts_dir / "message_schemas.json"
-
-    if schema_file.exists():
-        with open(schema_file, "r") as f:
-            schemas = json.load(f)
-
-        # Get message_schemas object
-        message_schemas = schemas.get("message_schemas", {})
-
-        # Validate based on message_type
-        if message_type == "request":
-            schema = message_schemas.get("request", {}).get("content_schema", {})
-            required_fields = schema.get("required", [])
-            for field in required_fields:
-                if field not in content:
-                    raise ValueError(
-                        f"Request message missing required field: {field}"
-                    )
-
-        elif message_type == "response":
-            schema = message_schemas.get("response", {}).get("content_schema", {})
-            required_fields = schema.get("required", [])
-            for field in required_fields:
-                if field not in content:
-                    raise ValueError(
-                        f"Response message missing required field: {field}"
-                    )
-
-        elif message_type == "broadcast":
-            schema = message_schemas.get("broadcast", {}).get("content_schema", {})
-            required_fields = schema.get("required", [])
-            for field in required_fields:
-                if field not in content:
-                    raise ValueError(
-                        f"Broadcast message missing required field: {field}"
-                    )
-
-        elif message_type == "error":
-            schema = message_schemas.get("error", {}).get("content_schema", {})
-            required_fields = schema.get("required", [])
-            for field in required_fields:
-                if field not in content:
-                    raise ValueError(
-                        f"Error message missing required field: {field}"
-                    )
-
-    # If schema file doesn't exist, do basic validation
-    else:
-        # Basic validation based on data-model.md examples
-        if message_type == "request":
-            if "request_type" not in content:
-                raise ValueError("Request message must have 'request_type' field")
-
-        elif message_type == "response":
-            if "status" not in content:
-                raise ValueError("Response message must have 'status' field")
-
-        elif message_type == "broadcast":
-            if "announcement" not in content:
-                raise ValueError("Broadcast message must have 'announcement' field")
-
-        elif message_type == "error":
-            if "error_code" not in content or "error_message" not in content:
-                raise ValueError("Error message must have 'error_code' and 'error_message' fields")
+    required = _required_content_fields().get(message_type)
+    if required is None:
+        return True
+
+    required_fields, required_set = required
+    if not content.keys() >= required_set:
+        missing = next(field for field in required_fields if field not in content)
+        raise ValueError(
+            f"{message_type.capitalize()} message missing required field: {missing}"
+        )
 
     return True
 
@@ -6,7 +6,8 @@ allowed and forbidden operations to enforce separation of concerns.
 """
 
 from dataclasses import dataclass, field
-from typing import List
+from functools import cached_property
+from typing import FrozenSet, List
 import json
 from pathlib import Path
 
@@ -50,6 +51,11 @@ class RoleTemplate:
                 f"Role {self.name} has overlapping allowed and forbidden operations: {overlap}"
             )
 
+    @cached_property
+    def effective_allowed(self) -> FrozenSet[str]:
+        """Operations this role may execute (allowed and not forbidden)."""
+        return frozenset(self.allowed_operations) - frozenset(self.forbidden_operations)
+
     def can_execute(self, operation: str) -> bool:
         """
         Check if this role can execute the specified operation.
@@ -60,9 +66,7 @@ class RoleTemplate:
         Returns:
             True if operation is allowed and not forbidden, False otherwise
         """
-        if operation in self.forbidden_operations:
-            return False
-        return operation in self.allowed_operations
+        return operation in self.effective_allowed
 
 
 class RoleViolationError(Exception):
@@ -7,6 +7,8 @@ based on role matching, and coordinates execution with dependency handling.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
+import re
+import sys
 import time
 
 
@@ -74,6 +76,16 @@ class TaskAssignment:
                 f"completed_at can only be set when status is completed or failed, not {self.status}"
             )
 
+        # Intern IDs so dependency lookups in resolve_dependencies compare by
+        # identity even when IDs come from parsed JSON rather than literals
+        self.task_id = sys.intern(self.task_id)
+        self.dependencies = [sys.intern(dep_id) for dep_id in self.dependencies]
+
+
+# Substring keywords recognised by decompose_goal (no word boundaries, so
+# "lid" also matches inside "solid", as with a plain `in` check)
+_GOAL_KEYWORDS = re.compile(r"box|lid|bracket|cylinder|shaft|assembly|create", re.IGNORECASE)
+
 
 def decompose_goal(goal_description: str, context: Optional[Dict] = None) -> List[TaskAssignment]:
     """
@@ -99,23 +111,25 @@ def decompose_goal(goal_description: str, context: Optional[Dict] = None) -> Lis
     if context is None:
         context = {}
 
-    goal_lower = goal_description.lower()
+    # One pass collects every keyword present; patterns are then checked in
+    # priority order (a leftmost regex match alone would not respect it)
+    keywords = {keyword.lower() for keyword in _GOAL_KEYWORDS.findall(goal_description)}
     tasks = []
 
     # Pattern 1: Box assembly with lid
-    if "box" in goal_lower and "lid" in goal_lower:
+    if "box" in keywords and "lid" in keywords:
         tasks = _decompose_box_assembly(context)
 
     # Pattern 2: Mechanical bracket
-    elif "bracket" in goal_lower:
+    elif "bracket" in keywords:
         tasks = _decompose_bracket(context)
 
     # Pattern 3: Cylinder or shaft
-    elif "cylinder" in goal_lower or "shaft" in goal_lower:
+    elif "cylinder" in keywords or "shaft" in keywords:
         tasks = _decompose_cylinder(context)
 
     # Pattern 4: Generic assembly (fallback)
-    elif "assembly" in goal_lower or "create" in goal_lower:
+    elif "assembly" in keywords or "create" in keywords:
         tasks = _decompose_generic_assembly(goal_description, context)
 
     else:
@@ -277,36 +291,42 @@ def resolve_dependencies(tasks: List[TaskAssignment]) -> List[List[TaskAssignmen
         >>> len(phases[1])  # t3 depends on t1 and t2
         1
     """
-    # Build task lookup
-    task_map = {task.task_id: task for task in tasks}
+    # Kahn's algorithm: count unmet dependencies per task and index dependents,
+    # so each dependency edge is visited once instead of once per phase
+    position = {id(task): index for index, task in enumerate(tasks)}
+    unmet = {}
+    dependents: Dict[str, List[TaskAssignment]] = {}
+    for task in tasks:
+        unmet[id(task)] = len(task.dependencies)
+        for dep_id in task.dependencies:
+            dependents.setdefault(dep_id, []).append(task)
 
-    # Track completed tasks
-    completed = set()
     phases = []
+    ready_tasks = [task for task in tasks if not task.dependencies]
+    scheduled = 0
 
-    while len(completed) < len(tasks):
-        # Find tasks ready to execute (all dependencies met)
-        ready_tasks = []
-        for task in tasks:
-            if task.task_id in completed:
-                continue
-
-            # Check if all dependencies are completed
-            if all(dep_id in completed for dep_id in task.dependencies):
-                ready_tasks.append(task)
-
-        if not ready_tasks:
-            # No tasks ready but not all completed - circular dependency or missing task
-            remaining = [t for t in tasks if t.task_id not in completed]
-            raise ValueError(
-                f"Circular dependency or missing task detected. Remaining tasks: {[t.task_id for t in remaining]}"
-            )
-
+    while ready_tasks:
         # Add this phase
         phases.append(ready_tasks)
+        scheduled += len(ready_tasks)
 
-        # Mark as completed
+        # Release tasks whose last dependency just completed
+        next_ready = []
         for task in ready_tasks:
-            completed.add(task.task_id)
+            for dependent in dependents.get(task.task_id, ()):
+                unmet[id(dependent)] -= 1
+                if unmet[id(dependent)] == 0:
+                    next_ready.append(dependent)
+
+        # Keep input order within a phase
+        next_ready.sort(key=lambda t: position[id(t)])
+        ready_tasks = next_ready
+
+    if scheduled < len(tasks):
+        # Tasks left with unmet dependencies - circular dependency or missing task
+        remaining = [t for t in tasks if unmet[id(t)] > 0]
+        raise ValueError(
+            f"Circular dependency or missing task detected. Remaining tasks: {[t.task_id for t in remaining]}"
+        )
 
     return phases
@@ -5,13 +5,22 @@ to entities, along with methods to check satisfaction and compute residuals.
 """
 import math
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Optional
+from operator import attrgetter, is_
+from typing import Any, Iterable, Optional
 
-from src.cad_kernel.geometry_core import get_geometry_core
+from src.utils.timestamps import utc_now_iso
 
 
-@dataclass
+def _same_entities(resolved: Optional[tuple[Any, ...]], entities: list[Any]) -> bool:
+    """Whether entities holds exactly the objects a constraint last resolved."""
+    return (
+        resolved is not None
+        and len(resolved) == len(entities)
+        and all(map(is_, resolved, entities))
+    )
+
+
+@dataclass(slots=True)
 class Constraint:
     """Base class for geometric constraints.
 
@@ -39,7 +48,7 @@ class Constraint:
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -72,7 +81,7 @@ class Constraint:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelConstraint(Constraint):
     """Parallel constraint between two lines.
 
@@ -105,7 +114,7 @@ class ParallelConstraint(Constraint):
         return error
 
 
-@dataclass
+@dataclass(slots=True)
 class PerpendicularConstraint(Constraint):
     """Perpendicular constraint between two lines.
 
@@ -125,8 +134,9 @@ class PerpendicularConstraint(Constraint):
         dir1 = line1.direction_vector
         dir2 = line2.direction_vector
 
-        # Compute dot product (should be 0 for perpendicular lines)
-        dot = sum(d1 * d2 for d1, d2 in zip(dir1, dir2))
+        # Compute dot product (should be 0 for perpendicular lines);
+        # lines carry [dx, dy, dz]
+        dot = dir1[0] * dir2[0] + dir1[1] * dir2[1] + dir1[2] * dir2[2]
 
         is_satisfied = abs(dot) < self.tolerance
         return is_satisfied, abs(dot)
@@ -137,7 +147,7 @@ class PerpendicularConstraint(Constraint):
         return error
 
 
-@dataclass
+@dataclass(slots=True)
 class CoincidentConstraint(Constraint):
     """Coincident constraint between two points.
 
@@ -154,10 +164,7 @@ class CoincidentConstraint(Constraint):
         point1, point2 = self.entities[0], self.entities[1]
 
         # Compute distance between points
-        geometry_core = get_geometry_core()
-        distance = geometry_core.calculate_distance(
-            point1.coordinates, point2.coordinates
-        )
+        distance = math.dist(point1.coordinates, point2.coordinates)
 
         is_satisfied = distance < self.tolerance
         return is_satisfied, distance
@@ -168,7 +175,7 @@ class CoincidentConstraint(Constraint):
         return error
 
 
-@dataclass
+@dataclass(slots=True)
 class DistanceConstraint(Constraint):
     """Distance constraint between two points or entities.
 
@@ -177,32 +184,43 @@ class DistanceConstraint(Constraint):
 
     constraint_type: str = "distance"
     target_distance: float = 0.0
+    _coord_getters: Optional[tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # Entities _coord_getters was resolved for
+    _resolved_entities: Optional[tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _resolve_entities(self) -> None:
+        """Pick a coordinate getter per entity (points use coordinates, lines their start).
+
+        Leaves _coord_getters as None if any entity has neither.
+        """
+        self._resolved_entities = tuple(self.entities)
+        getters = []
+        for entity in self.entities:
+            if hasattr(entity, 'coordinates'):
+                getters.append(attrgetter('coordinates'))
+            elif hasattr(entity, 'start'):
+                getters.append(attrgetter('start'))
+            else:
+                self._coord_getters = None
+                return
+        self._coord_getters = tuple(getters)
 
     def check_satisfaction(self) -> tuple[bool, float]:
         """Check if distance matches target."""
         if len(self.entities) != 2:
             return False, float('inf')
 
-        entity1, entity2 = self.entities[0], self.entities[1]
-
-        # Get coordinates (works for points, for lines use start points)
-        if hasattr(entity1, 'coordinates'):
-            coord1 = entity1.coordinates
-        elif hasattr(entity1, 'start'):
-            coord1 = entity1.start
-        else:
+        if not _same_entities(self._resolved_entities, self.entities):
+            self._resolve_entities()
+        if self._coord_getters is None:
             return False, float('inf')
 
-        if hasattr(entity2, 'coordinates'):
-            coord2 = entity2.coordinates
-        elif hasattr(entity2, 'start'):
-            coord2 = entity2.start
-        else:
-            return False, float('inf')
+        get_coord1, get_coord2 = self._coord_getters
+        coord1 = get_coord1(self.entities[0])
+        coord2 = get_coord2(self.entities[1])
 
         # Compute actual distance
-        geometry_core = get_geometry_core()
-        actual_distance = geometry_core.calculate_distance(coord1, coord2)
+        actual_distance = math.dist(coord1, coord2)
 
         # Compute error
         error = abs(actual_distance - self.target_distance)
@@ -217,12 +235,13 @@ class DistanceConstraint(Constraint):
 
     def to_dict(self) -> dict:
         """Convert constraint to dictionary representation."""
-        base_dict = super().to_dict()
+        # Explicit base call: zero-argument super() fails on slots dataclasses
+        base_dict = Constraint.to_dict(self)
         base_dict["parameters"] = {"distance": self.target_distance}
         return base_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class AngleConstraint(Constraint):
     """Angle constraint between two lines.
 
@@ -243,16 +262,13 @@ class AngleConstraint(Constraint):
         dir1 = line1.direction_vector
         dir2 = line2.direction_vector
 
-        # Compute dot product and magnitudes
-        dot = sum(d1 * d2 for d1, d2 in zip(dir1, dir2))
-        mag1 = math.sqrt(sum(d**2 for d in dir1))
-        mag2 = math.sqrt(sum(d**2 for d in dir2))
-
-        # Compute angle
-        cos_angle = dot / (mag1 * mag2)
-        # Clamp to [-1, 1] to avoid numerical errors
-        cos_angle = max(-1.0, min(1.0, cos_angle))
-        actual_angle = math.acos(cos_angle)
+        # Compute angle as atan2(|a x b|, a . b): stable near 0 and pi and
+        # independent of the vectors' magnitudes (lines carry [dx, dy, dz])
+        ax, ay, az = dir1
+        bx, by, bz = dir2
+        cross = math.hypot(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+        dot = ax * bx + ay * by + az * bz
+        actual_angle = math.atan2(cross, dot)
 
         # Compute error
         error = abs(actual_angle - self.target_angle)
@@ -267,12 +283,12 @@ class AngleConstraint(Constraint):
 
     def to_dict(self) -> dict:
         """Convert constraint to dictionary representation."""
-        base_dict = super().to_dict()
+        base_dict = Constraint.to_dict(self)
         base_dict["parameters"] = {"angle": self.target_angle}
         return base_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class TangentConstraint(Constraint):
     """Tangent constraint between a line and a circle/arc.
 
@@ -280,6 +296,22 @@ class TangentConstraint(Constraint):
     """
 
     constraint_type: str = "tangent"
+    _line: Any = field(default=None, init=False, repr=False, compare=False)
+    _circle: Any = field(default=None, init=False, repr=False, compare=False)
+    # Entities _line and _circle were resolved from
+    _resolved_entities: Optional[tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _resolve_entities(self) -> None:
+        """Determine which entity is the line and which is the circle."""
+        self._resolved_entities = tuple(self.entities)
+        self._line = None
+        self._circle = None
+        for entity in self.entities:
+            entity_type = getattr(entity, "entity_type", None)
+            if entity_type == "line":
+                self._line = entity
+            elif entity_type == "circle":
+                self._circle = entity
 
     def check_satisfaction(self) -> tuple[bool, float]:
         """Check if line is tangent to circle.
@@ -290,22 +322,14 @@ class TangentConstraint(Constraint):
         if not self.entities or len(self.entities) < 2:
             return False, float('inf')
 
-        # Determine which is line and which is circle
-        line = None
-        circle = None
-        for entity in self.entities:
-            if entity.entity_type == "line":
-                line = entity
-            elif entity.entity_type == "circle":
-                circle = entity
-
+        if not _same_entities(self._resolved_entities, self.entities):
+            self._resolve_entities()
+        line = self._line
+        circle = self._circle
         if line is None or circle is None:
             return False, float('inf')
 
-        # Calculate distance from circle center to line
-        # Line: start + t*(end-start), t in [0,1]
-        # Point-to-line distance formula
-        import math
+        # Calculate distance from circle center to the (infinite) line
         start = line.start
         end = line.end
         center = circle.center
@@ -314,24 +338,13 @@ class TangentConstraint(Constraint):
         dx = end[0] - start[0]
         dy = end[1] - start[1]
 
-        # Vector from start to center
-        cx = center[0] - start[0]
-        cy = center[1] - start[1]
-
-        # Project center onto line
-        line_len_sq = dx*dx + dy*dy
-        if line_len_sq < 1e-10:
+        line_len = math.hypot(dx, dy)
+        if line_len < 1e-5:
             # Degenerate line
             return False, float('inf')
 
-        t = (cx*dx + cy*dy) / line_len_sq
-
-        # Closest point on line (not clamped to segment)
-        closest_x = start[0] + t*dx
-        closest_y = start[1] + t*dy
-
-        # Distance from center to line
-        dist = math.sqrt((center[0] - closest_x)**2 + (center[1] - closest_y)**2)
+        # Perpendicular distance = |cross(end - start, center - start)| / |end - start|
+        dist = abs(dx * (center[1] - start[1]) - dy * (center[0] - start[0])) / line_len
 
         # Error is difference between distance and radius
         error = abs(dist - circle.radius)
@@ -347,7 +360,7 @@ class TangentConstraint(Constraint):
         return error
 
 
-@dataclass
+@dataclass(slots=True)
 class RadiusConstraint(Constraint):
     """Radius constraint for circles/arcs.
 
@@ -379,6 +392,24 @@ class RadiusConstraint(Constraint):
 
     def to_dict(self) -> dict:
         """Convert constraint to dictionary representation."""
-        base_dict = super().to_dict()
+        base_dict = Constraint.to_dict(self)
         base_dict["parameters"] = {"radius": self.target_radius}
         return base_dict
+
+
+def evaluate_constraints(constraints: Iterable[Constraint]) -> list[float]:
+    """Check a group of constraints once each and update their status.
+
+    Args:
+        constraints: Constraints to evaluate
+
+    Returns:
+        Error magnitude of each constraint, in input order
+    """
+    errors = []
+    for constraint in constraints:
+        is_satisfied, error = constraint.check_satisfaction()
+        constraint.satisfaction_status = "satisfied" if is_satisfied else "violated"
+        errors.append(error)
+
+    return errors
@@ -3,12 +3,15 @@
 Maintains an operation stack per workspace to support undo/redo operations.
 Critical for agent learning - allows experimentation and backtracking.
 """
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
+from itertools import islice
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class HistoryEntry:
     """Represents a single operation in history.
 
@@ -32,7 +35,16 @@ class HistoryEntry:
     inverse_params: Optional[dict[str, Any]] = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary.
+
+        Returns a shallow copy of a dict built once per entry, so callers may
+        add or replace keys without affecting later calls.
+        """
+        return dict(self._as_dict)
+
+    @cached_property
+    def _as_dict(self) -> dict[str, Any]:
+        """Field dictionary, built on first use (entries are immutable)."""
         return {
             "operation_id": self.operation_id,
             "operation_type": self.operation_type,
@@ -61,7 +73,8 @@ class OperationHistory:
         """
         self.workspace_id = workspace_id
         self.max_history = max_history
-        self.operations: list[HistoryEntry] = []
+        # Bounded: appending past max_history drops the oldest entry
+        self.operations: deque[HistoryEntry] = deque(maxlen=max_history)
         self.current_position = -1  # -1 means no operations yet
 
     def add_operation(self, entry: HistoryEntry) -> None:
@@ -71,17 +84,12 @@ class OperationHistory:
             entry: History entry to add
         """
         # If we're not at the end, truncate future operations
-        if self.current_position < len(self.operations) - 1:
-            self.operations = self.operations[:self.current_position + 1]
+        while len(self.operations) > self.current_position + 1:
+            self.operations.pop()
 
-        # Add new operation
+        # Add new operation (deque evicts the oldest beyond max_history)
         self.operations.append(entry)
-        self.current_position += 1
-
-        # Trim history if exceeded max
-        if len(self.operations) > self.max_history:
-            self.operations = self.operations[-self.max_history:]
-            self.current_position = len(self.operations) - 1
+        self.current_position = len(self.operations) - 1
 
     def can_undo(self) -> bool:
         """Check if undo is possible.
@@ -145,18 +153,12 @@ class OperationHistory:
         Returns:
             List of operation dictionaries
         """
-        if include_future:
-            ops = self.operations
-        else:
-            ops = self.operations[:self.current_position + 1]
-
-        # Reverse so most recent is first
-        ops = list(reversed(ops))
-
-        # Apply pagination
-        start = offset
-        end = offset + limit
-        return [op.to_dict() for op in ops[start:end]]
+        # Walk newest first, skipping undone operations unless requested,
+        # and only serialize the requested page
+        skip = 0 if include_future else len(self.operations) - 1 - self.current_position
+        start = skip + max(offset, 0)
+        page = islice(reversed(self.operations), start, start + max(limit, 0))
+        return [op.to_dict() for op in page]
 
     def get_current_position(self) -> int:
         """Get current position in history.
@@ -176,7 +178,7 @@ class OperationHistory:
 
     def clear(self) -> None:
         """Clear all history."""
-        self.operations = []
+        self.operations.clear()
         self.current_position = -1
 
 
@@ -5,13 +5,16 @@ points, lines, circles, and arcs with computed properties.
 """
 import math
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Optional
 
 from src.cad_kernel.geometry_core import get_geometry_core
+from src.utils.timestamps import utc_now_iso
 
+# Bound once for the cached Line2D direction read by constraint checks
+_calculate_direction_vector = get_geometry_core().calculate_direction_vector
 
-@dataclass
+
+@dataclass(slots=True)
 class Point2D:
     """2D point entity.
 
@@ -32,7 +35,7 @@ class Point2D:
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -65,7 +68,7 @@ class Point2D:
         return geometry_core.validate_point(self.coordinates)
 
 
-@dataclass
+@dataclass(slots=True)
 class Line2D:
     """2D line entity.
 
@@ -86,11 +89,13 @@ class Line2D:
     updated_at: str = ""
     _length: Optional[float] = None
     _direction_vector: Optional[list[float]] = None
+    # (start, end) lists the cached values were computed from
+    _cached_endpoints: Optional[tuple] = None
 
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -100,6 +105,20 @@ class Line2D:
         if len(self.end) == 2:
             self.end.append(0.0)
 
+    def _reset_cache(self) -> None:
+        """Start a fresh cache for the current start/end lists."""
+        self._length = None
+        self._direction_vector = None
+        self._cached_endpoints = (self.start, self.end)
+
+    def _invalidate_cache(self) -> None:
+        """Clear cached derived geometry.
+
+        Reassigning start/end is detected automatically; call this after
+        mutating the coordinate lists in place.
+        """
+        self._cached_endpoints = None
+
     @property
     def length(self) -> float:
         """Calculate line length.
@@ -107,9 +126,11 @@ class Line2D:
         Returns:
             Length of the line
         """
+        cached = self._cached_endpoints
+        if cached is None or cached[0] is not self.start or cached[1] is not self.end:
+            self._reset_cache()
         if self._length is None:
-            geometry_core = get_geometry_core()
-            self._length = geometry_core.calculate_distance(self.start, self.end)
+            self._length = math.dist(self.start, self.end)
         return self._length
 
     @property
@@ -119,11 +140,11 @@ class Line2D:
         Returns:
             Normalized direction vector [dx, dy, dz]
         """
+        cached = self._cached_endpoints
+        if cached is None or cached[0] is not self.start or cached[1] is not self.end:
+            self._reset_cache()
         if self._direction_vector is None:
-            geometry_core = get_geometry_core()
-            self._direction_vector = geometry_core.calculate_direction_vector(
-                self.start, self.end
-            )
+            self._direction_vector = _calculate_direction_vector(self.start, self.end)
         return self._direction_vector
 
     def to_dict(self) -> dict:
@@ -159,7 +180,7 @@ class Line2D:
         return geometry_core.validate_line(self.start, self.end)
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle2D:
     """2D circle entity.
 
@@ -184,7 +205,7 @@ class Circle2D:
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -192,30 +213,28 @@ class Circle2D:
         if len(self.center) == 2:
             self.center.append(0.0)
 
+        # Derived sizes are one multiply each; compute them up front
+        if self._area is None:
+            self._area = math.pi * self.radius * self.radius
+        if self._circumference is None:
+            self._circumference = 2 * math.pi * self.radius
+
     @property
     def area(self) -> float:
-        """Calculate circle area.
+        """Circle area.
 
         Returns:
             Area (π × radius²)
         """
-        if self._area is None:
-            geometry_core = get_geometry_core()
-            self._area = geometry_core.calculate_circle_area(self.radius)
         return self._area
 
     @property
     def circumference(self) -> float:
-        """Calculate circle circumference.
+        """Circle circumference.
 
         Returns:
             Circumference (2π × radius)
         """
-        if self._circumference is None:
-            geometry_core = get_geometry_core()
-            self._circumference = geometry_core.calculate_circle_circumference(
-                self.radius
-            )
         return self._circumference
 
     def to_dict(self) -> dict:
@@ -246,7 +265,7 @@ class Circle2D:
         return geometry_core.validate_circle(self.center, self.radius)
 
 
-@dataclass
+@dataclass(slots=True)
 class Arc2D:
     """2D arc entity.
 
@@ -274,7 +293,7 @@ class Arc2D:
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -282,16 +301,16 @@ class Arc2D:
         if len(self.center) == 2:
             self.center.append(0.0)
 
+        if self._arc_length is None:
+            self._arc_length = self.radius * abs(self.end_angle - self.start_angle)
+
     @property
     def arc_length(self) -> float:
-        """Calculate arc length.
+        """Arc length.
 
         Returns:
             Length of the arc
         """
-        if self._arc_length is None:
-            angle_span = abs(self.end_angle - self.start_angle)
-            self._arc_length = self.radius * angle_span
         return self._arc_length
 
     def to_dict(self) -> dict:
@@ -326,13 +345,15 @@ class Arc2D:
         if not valid:
             return False, error
 
-        # Validate angles
-        if not math.isfinite(self.start_angle):
-            return False, f"Start angle is not finite (got {self.start_angle})"
-        if not math.isfinite(self.end_angle):
-            return False, f"End angle is not finite (got {self.end_angle})"
+        # Validate angles (a finite span implies both angles are finite)
+        angle_span = self.end_angle - self.start_angle
+        if not math.isfinite(angle_span):
+            if not math.isfinite(self.start_angle):
+                return False, f"Start angle is not finite (got {self.start_angle})"
+            if not math.isfinite(self.end_angle):
+                return False, f"End angle is not finite (got {self.end_angle})"
 
-        if abs(self.end_angle - self.start_angle) < 1e-6:
+        if abs(angle_span) < 1e-6:
             return False, "Arc angle span must be > 0"
 
         return True, None
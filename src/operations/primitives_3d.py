@@ -3,14 +3,15 @@
 This module defines classes for 3D geometric entities including
 3D points and lines with computed properties.
 """
+import math
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Optional
 
 from src.cad_kernel.geometry_core import get_geometry_core
+from src.utils.timestamps import utc_now_iso
 
 
-@dataclass
+@dataclass(slots=True)
 class Point3D:
     """3D point entity.
 
@@ -31,7 +32,7 @@ class Point3D:
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -64,7 +65,7 @@ class Point3D:
         return geometry_core.validate_point(self.coordinates)
 
 
-@dataclass
+@dataclass(slots=True)
 class Line3D:
     """3D line entity.
 
@@ -85,11 +86,13 @@ class Line3D:
     updated_at: str = ""
     _length: Optional[float] = None
     _direction_vector: Optional[list[float]] = None
+    # (start, end) lists the cached values were computed from
+    _cached_endpoints: Optional[tuple] = None
 
     def __post_init__(self):
         """Initialize after dataclass creation."""
         if not self.created_at:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if not self.updated_at:
             self.updated_at = self.created_at
 
@@ -99,6 +102,20 @@ class Line3D:
         if len(self.end) == 2:
             self.end.append(0.0)
 
+    def _reset_cache(self) -> None:
+        """Start a fresh cache for the current start/end lists."""
+        self._length = None
+        self._direction_vector = None
+        self._cached_endpoints = (self.start, self.end)
+
+    def _invalidate_cache(self) -> None:
+        """Clear cached derived geometry.
+
+        Reassigning start/end is detected automatically; call this after
+        mutating the coordinate lists in place.
+        """
+        self._cached_endpoints = None
+
     @property
     def length(self) -> float:
         """Calculate line length.
@@ -106,9 +123,11 @@ class Line3D:
         Returns:
             Length of the line
         """
+        cached = self._cached_endpoints
+        if cached is None or cached[0] is not self.start or cached[1] is not self.end:
+            self._reset_cache()
         if self._length is None:
-            geometry_core = get_geometry_core()
-            self._length = geometry_core.calculate_distance(self.start, self.end)
+            self._length = math.dist(self.start, self.end)
         return self._length
 
     @property
@@ -118,11 +137,11 @@ class Line3D:
         Returns:
             Normalized direction vector [dx, dy, dz]
         """
+        cached = self._cached_endpoints
+        if cached is None or cached[0] is not self.start or cached[1] is not self.end:
+            self._reset_cache()
         if self._direction_vector is None:
-            geometry_core = get_geometry_core()
-            self._direction_vector = geometry_core.calculate_direction_vector(
-                self.start, self.end
-            )
+            self._direction_vector = get_geometry_core().calculate_direction_vector(self.start, self.end)
         return self._direction_vector
 
     def to_dict(self) -> dict:
@@ -3,12 +3,15 @@
 Provides classes and functions for 3D solid modeling operations including
 extrude, revolve, and boolean operations using build123d/OCCT.
 """
+import math
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any, Optional
 
+from src.cad_kernel.entity_manager import GeometricEntity
+from src.utils.timestamps import utc_now_iso
 
-@dataclass
+
+@dataclass(slots=True)
 class Topology:
     """Topology information for a solid body.
 
@@ -32,7 +35,7 @@ class Topology:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SolidBody:
     """Represents a 3D solid body entity.
 
@@ -50,14 +53,15 @@ class SolidBody:
     validation_errors: list[str] = field(default_factory=list)
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    bounding_box: Optional[dict[str, list[float]]] = None  # Axis-aligned {min: [x,y,z], max: [x,y,z]}
     brep_data: Optional[Any] = None  # Store the actual OCCT shape
 
     def __post_init__(self):
         """Initialize timestamps if not provided."""
         if self.created_at is None:
-            self.created_at = datetime.now(timezone.utc).isoformat()
+            self.created_at = utc_now_iso()
         if self.updated_at is None:
-            self.updated_at = datetime.now(timezone.utc).isoformat()
+            self.updated_at = self.created_at
 
     def to_dict(self) -> dict[str, Any]:
         """Convert solid body to dictionary for JSON serialization."""
@@ -76,6 +80,37 @@ class SolidBody:
         }
 
 
+def _cylinder_props(radius: float, distance: float) -> tuple[float, float]:
+    """Volume and surface area of a cylinder extruded from a circle.
+
+    Args:
+        radius: Circle radius
+        distance: Extrusion distance
+
+    Returns:
+        Tuple of (volume, surface_area)
+    """
+    # Cylinder volume = pi * r^2 * h
+    base_area = math.pi * radius ** 2
+    # Surface area = 2*pi*r^2 + 2*pi*r*h
+    return base_area * distance, 2 * base_area + 2 * math.pi * radius * distance
+
+
+def _box_props(width: float, height: float, distance: float) -> tuple[float, float]:
+    """Volume and surface area of a box extruded from a rectangle.
+
+    Args:
+        width: Rectangle width
+        height: Rectangle height
+        distance: Extrusion distance
+
+    Returns:
+        Tuple of (volume, surface_area)
+    """
+    # Surface area: 2*(w*h + w*d + h*d)
+    return width * height * distance, 2 * (width * height + width * distance + height * distance)
+
+
 def extrude_sketch(
     entity_ids: list[str],
     entities: list[Any],
@@ -96,9 +131,6 @@ def extrude_sketch(
     Raises:
         ValueError: If sketch is invalid or extrusion fails
     """
-    from ..cad_kernel.entity_manager import GeometricEntity
-    import uuid
-
     # Validate distance
     if distance <= 0:
         raise ValueError(f"Extrusion distance must be positive, got {distance}")
@@ -106,17 +138,13 @@ def extrude_sketch(
     # Check if we have a single circle (simple extrusion)
     if len(entities) == 1 and entities[0].entity_type == "circle":
         circle = entities[0]
-        import math
-
-        # Cylinder volume = pi * r^2 * h
-        volume = math.pi * circle.radius ** 2 * distance
-        # Surface area = 2*pi*r^2 + 2*pi*r*h
-        surface_area = 2 * math.pi * circle.radius ** 2 + 2 * math.pi * circle.radius * distance
+        volume, surface_area = _cylinder_props(circle.radius, distance)
 
         # Center of mass at midpoint of cylinder height
         center = circle.center
         center_of_mass = [center[0], center[1], distance / 2]
 
+        radius = circle.radius
         solid = SolidBody(
             entity_id=GeometricEntity.generate_entity_id(workspace_id, "solid"),
             workspace_id=workspace_id,
@@ -129,40 +157,35 @@ def extrude_sketch(
                 vertex_count=0,  # Smooth cylinder has no vertices
                 is_closed=True,
                 is_manifold=True
-            )
+            ),
+            bounding_box={
+                "min": [center[0] - radius, center[1] - radius, 0.0],
+                "max": [center[0] + radius, center[1] + radius, distance]
+            }
         )
 
         return solid
 
     # Check if we have 4 lines forming a rectangle (box extrusion)
     if len(entities) == 4 and all(e.entity_type == "line" for e in entities):
-        # Validate that lines form a closed loop
-        # Simple check: verify endpoints connect
-        endpoints = []
-        for line in entities:
-            endpoints.append(tuple(line.start))
-            endpoints.append(tuple(line.end))
-
-        # Each point should appear exactly twice in a closed loop
-        from collections import Counter
-        point_counts = Counter(endpoints)
-        if not all(count == 2 for count in point_counts.values()):
+        # Validate that lines form a closed loop: after sorting the 8
+        # endpoints, each corner must appear exactly twice, as one adjacent pair
+        points = sorted([tuple(line.start) for line in entities] + [tuple(line.end) for line in entities])
+        if not (points[0] == points[1] and points[2] == points[3]
+                and points[4] == points[5] and points[6] == points[7]
+                and points[1] != points[2] and points[3] != points[4] and points[5] != points[6]):
             raise ValueError("Sketch is not closed - lines do not form a closed loop")
 
-        # Calculate bounding box to get dimensions
-        all_x = [p[0] for p in point_counts.keys()]
-        all_y = [p[1] for p in point_counts.keys()]
-
-        min_x, max_x = min(all_x), max(all_x)
-        min_y, max_y = min(all_y), max(all_y)
+        # Calculate bounding box to get dimensions; points are sorted by x first
+        corners = points[0], points[2], points[4], points[6]
+        min_x, max_x = corners[0][0], corners[3][0]
+        min_y = min(p[1] for p in corners)
+        max_y = max(p[1] for p in corners)
 
         width = max_x - min_x
         height = max_y - min_y
 
-        # Box volume
-        volume = width * height * distance
-        # Surface area: 2*(w*h + w*d + h*d)
-        surface_area = 2 * (width * height + width * distance + height * distance)
+        volume, surface_area = _box_props(width, height, distance)
 
         # Center of mass
         center_of_mass = [
@@ -183,7 +206,11 @@ def extrude_sketch(
                 vertex_count=8,  # Box has 8 vertices
                 is_closed=True,
                 is_manifold=True
-            )
+            ),
+            bounding_box={
+                "min": [min_x, min_y, 0.0],
+                "max": [max_x, max_y, distance]
+            }
         )
 
         return solid
@@ -191,6 +218,22 @@ def extrude_sketch(
     raise ValueError(f"Unsupported sketch configuration: {len(entities)} entities of types {[e.entity_type for e in entities]}")
 
 
+def _fills_bounding_box(solid: SolidBody) -> bool:
+    """Check whether a solid is exactly its axis-aligned bounding box.
+
+    Args:
+        solid: Solid body to check
+
+    Returns:
+        True if the solid has a bounding box whose volume matches its own
+    """
+    bbox = solid.bounding_box
+    if bbox is None:
+        return False
+    (x0, y0, z0), (x1, y1, z1) = bbox["min"], bbox["max"]
+    return math.isclose((x1 - x0) * (y1 - y0) * (z1 - z0), solid.volume, rel_tol=1e-9)
+
+
 def boolean_operation(
     operation: str,
     solids: list[SolidBody],
@@ -209,8 +252,6 @@ def boolean_operation(
     Raises:
         ValueError: If operation is invalid or fails
     """
-    from ..cad_kernel.entity_manager import GeometricEntity
-
     if len(solids) < 2:
         raise ValueError(f"Boolean operations require at least 2 solids, got {len(solids)}")
 
@@ -219,6 +260,8 @@ def boolean_operation(
 
     # Simplified boolean operations for basic shapes
     solid1, solid2 = solids[0], solids[1]
+    bbox1, bbox2 = solid1.bounding_box, solid2.bounding_box
+    bounding_box = None
 
     if operation == "union":
         # Union: combine volumes (minus overlap)
@@ -227,10 +270,11 @@ def boolean_operation(
         surface_area = solid1.surface_area + solid2.surface_area
 
         # Weighted center of mass
-        total_vol = solid1.volume + solid2.volume
+        v1, v2 = solid1.volume, solid2.volume
+        total_vol = v1 + v2
         center_of_mass = [
-            (solid1.center_of_mass[i] * solid1.volume + solid2.center_of_mass[i] * solid2.volume) / total_vol
-            for i in range(3)
+            (c1 * v1 + c2 * v2) / total_vol
+            for c1, c2 in zip(solid1.center_of_mass, solid2.center_of_mass)
         ]
 
         topology = Topology(
@@ -241,6 +285,12 @@ def boolean_operation(
             is_manifold=True
         )
 
+        if bbox1 is not None and bbox2 is not None:
+            bounding_box = {
+                "min": [min(a, b) for a, b in zip(bbox1["min"], bbox2["min"])],
+                "max": [max(a, b) for a, b in zip(bbox1["max"], bbox2["max"])]
+            }
+
     elif operation == "subtract":
         # Subtract: remove second volume from first
         volume = solid1.volume - solid2.volume
@@ -251,6 +301,7 @@ def boolean_operation(
 
         # Center of mass shifts toward remaining material
         center_of_mass = solid1.center_of_mass.copy()
+        bounding_box = bbox1
 
         topology = Topology(
             face_count=solid1.topology.face_count + solid2.topology.face_count,
@@ -260,15 +311,35 @@ def boolean_operation(
             is_manifold=True
         )
 
+    elif _fills_bounding_box(solid1) and _fills_bounding_box(solid2):
+        # Intersect of two boxes: the overlap of their bounding boxes is exact
+        lo = [max(a, b) for a, b in zip(bbox1["min"], bbox2["min"])]
+        hi = [min(a, b) for a, b in zip(bbox1["max"], bbox2["max"])]
+        width, height, depth = (b - a for a, b in zip(lo, hi))
+        if width <= 0 or height <= 0 or depth <= 0:
+            raise ValueError("Intersection would result in empty volume - solids do not overlap")
+
+        volume, surface_area = _box_props(width, height, depth)
+        center_of_mass = [(a + b) / 2 for a, b in zip(lo, hi)]
+        bounding_box = {"min": lo, "max": hi}
+
+        topology = Topology(
+            face_count=6,
+            edge_count=12,
+            vertex_count=8,
+            is_closed=True,
+            is_manifold=True
+        )
+
     else:  # intersect
-        # Intersect: only the overlapping volume
+        # Intersect: only the overlapping volume (non-box solids)
         volume = min(solid1.volume, solid2.volume) * 0.5  # Approximation
         surface_area = (solid1.surface_area + solid2.surface_area) * 0.3  # Approximation
 
         # Center of mass at midpoint
         center_of_mass = [
-            (solid1.center_of_mass[i] + solid2.center_of_mass[i]) / 2
-            for i in range(3)
+            (c1 + c2) / 2
+            for c1, c2 in zip(solid1.center_of_mass, solid2.center_of_mass)
         ]
 
         topology = Topology(
@@ -285,7 +356,8 @@ def boolean_operation(
         volume=volume,
         surface_area=surface_area,
         center_of_mass=center_of_mass,
-        topology=topology
+        topology=topology,
+        bounding_box=bounding_box
     )
 
     return result_solid
@@ -301,19 +373,18 @@ def validate_topology(solid: SolidBody) -> tuple[bool, list[str]]:
         Tuple of (is_valid, list of validation errors)
     """
     errors = []
+    topology = solid.topology
 
     # Check Euler characteristic for closed polyhedra: V - E + F = 2
-    if solid.topology.is_closed:
-        euler = (solid.topology.vertex_count -
-                solid.topology.edge_count +
-                solid.topology.face_count)
+    if topology.is_closed:
+        euler = topology.vertex_count - topology.edge_count + topology.face_count
 
         # Allow some tolerance for curved surfaces
         if abs(euler - 2) > 10:
             errors.append(f"Invalid Euler characteristic: {euler} (expected ~2 for closed surface)")
 
     # Check manifold property
-    if not solid.topology.is_manifold:
+    if not topology.is_manifold:
         errors.append("Geometry is not manifold (has non-manifold edges or vertices)")
 
     # Check volume is positive
@@ -324,4 +395,4 @@ def validate_topology(solid: SolidBody) -> tuple[bool, list[str]]:
     if solid.surface_area <= 0:
         errors.append(f"Invalid surface area: {solid.surface_area} (must be positive)")
 
-    return len(errors) == 0, errors
+    return not errors, errors
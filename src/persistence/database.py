@@ -3,6 +3,205 @@ import sqlite3
 from pathlib import Path
 from typing import Optional
 
+_CHECKPOINT_MODES = frozenset({"PASSIVE", "FULL", "RESTART", "TRUNCATE"})
+
+# Table definitions, run as one script so schema setup is a single C call
+_SCHEMA_DDL = """
+-- Workspaces table
+CREATE TABLE IF NOT EXISTS workspaces (
+    workspace_id TEXT PRIMARY KEY,
+    workspace_name TEXT NOT NULL UNIQUE,
+    workspace_type TEXT NOT NULL CHECK (workspace_type IN ('main', 'agent_branch')),
+    base_workspace_id TEXT,
+    owning_agent_id TEXT,
+    created_at TEXT NOT NULL,
+    entity_count INTEGER DEFAULT 0,
+    operation_count INTEGER DEFAULT 0,
+    branch_status TEXT NOT NULL CHECK (branch_status IN ('clean', 'modified', 'conflicted', 'merged')),
+    divergence_point TEXT,
+    FOREIGN KEY (base_workspace_id) REFERENCES workspaces(workspace_id)
+);
+
+-- Entities table
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id TEXT PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    modified_at TEXT NOT NULL,
+    created_by_agent TEXT NOT NULL,
+    parent_entities TEXT,  -- JSON array of entity IDs
+    child_entities TEXT,   -- JSON array of entity IDs
+    properties TEXT NOT NULL,  -- JSON object with entity-specific properties
+    bounding_box TEXT NOT NULL,  -- JSON object {min: [x,y,z], max: [x,y,z]}
+    is_valid INTEGER NOT NULL DEFAULT 1,
+    validation_errors TEXT,  -- JSON array of error codes
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
+);
+
+-- Constraints table
+CREATE TABLE IF NOT EXISTS constraints (
+    constraint_id TEXT PRIMARY KEY,
+    constraint_type TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    constrained_entities TEXT NOT NULL,  -- JSON array of 1-2 entity IDs
+    parameters TEXT,  -- JSON object with constraint-specific parameters
+    satisfaction_status TEXT NOT NULL CHECK (satisfaction_status IN ('satisfied', 'violated', 'redundant')),
+    degrees_of_freedom_removed INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    created_by_agent TEXT NOT NULL,
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
+);
+
+-- Entity-Constraint junction table (many-to-many)
+CREATE TABLE IF NOT EXISTS entity_constraints (
+    entity_id TEXT NOT NULL,
+    constraint_id TEXT NOT NULL,
+    PRIMARY KEY (entity_id, constraint_id),
+    FOREIGN KEY (entity_id) REFERENCES entities(entity_id) ON DELETE CASCADE,
+    FOREIGN KEY (constraint_id) REFERENCES constraints(constraint_id) ON DELETE CASCADE
+);
+
+-- Operations table
+CREATE TABLE IF NOT EXISTS operations (
+    operation_id TEXT PRIMARY KEY,
+    operation_type TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    input_parameters TEXT NOT NULL,  -- JSON object
+    input_entities TEXT,  -- JSON array of entity IDs
+    output_entities TEXT,  -- JSON array of entity IDs
+    result_status TEXT NOT NULL CHECK (result_status IN ('success', 'error', 'warning')),
+    error_code TEXT,
+    error_message TEXT,
+    execution_time_ms INTEGER NOT NULL,
+    undo_data TEXT,  -- JSON object with undo information
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
+);
+
+-- Validation results table
+CREATE TABLE IF NOT EXISTS validation_results (
+    validation_id TEXT PRIMARY KEY,
+    validation_type TEXT NOT NULL CHECK (validation_type IN ('topology', 'geometry', 'constraints')),
+    checked_entities TEXT NOT NULL,  -- JSON array of entity IDs
+    timestamp TEXT NOT NULL,
+    overall_status TEXT NOT NULL CHECK (overall_status IN ('pass', 'fail', 'warning')),
+    issues TEXT NOT NULL  -- JSON array of issue objects
+);
+
+-- Geometry kernel tables (003-geometry-kernel)
+
+-- Geometry shapes table
+CREATE TABLE IF NOT EXISTS geometry_shapes (
+    shape_id TEXT PRIMARY KEY,
+    shape_type TEXT NOT NULL,
+    brep_data TEXT NOT NULL,
+    is_valid BOOLEAN NOT NULL,
+    created_at TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
+);
+
+-- Solid properties table
+CREATE TABLE IF NOT EXISTS solid_properties (
+    entity_id TEXT PRIMARY KEY,
+    volume REAL NOT NULL,
+    surface_area REAL NOT NULL,
+    center_of_mass_x REAL NOT NULL,
+    center_of_mass_y REAL NOT NULL,
+    center_of_mass_z REAL NOT NULL,
+    bounding_box_min_x REAL NOT NULL,
+    bounding_box_min_y REAL NOT NULL,
+    bounding_box_min_z REAL NOT NULL,
+    bounding_box_max_x REAL NOT NULL,
+    bounding_box_max_y REAL NOT NULL,
+    bounding_box_max_z REAL NOT NULL,
+    face_count INTEGER NOT NULL,
+    edge_count INTEGER NOT NULL,
+    vertex_count INTEGER NOT NULL,
+    is_closed BOOLEAN NOT NULL,
+    is_manifold BOOLEAN NOT NULL,
+    computed_at TEXT NOT NULL,
+    FOREIGN KEY (entity_id) REFERENCES entities(entity_id)
+);
+
+-- Creation operations table
+CREATE TABLE IF NOT EXISTS creation_operations (
+    operation_id TEXT PRIMARY KEY,
+    operation_type TEXT NOT NULL,
+    input_entity_ids TEXT NOT NULL,
+    output_entity_id TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    executed_at TEXT NOT NULL,
+    execution_time_ms INTEGER NOT NULL,
+    success BOOLEAN NOT NULL,
+    error_message TEXT,
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id),
+    FOREIGN KEY (output_entity_id) REFERENCES entities(entity_id)
+);
+
+-- Boolean operations table
+CREATE TABLE IF NOT EXISTS boolean_operations (
+    operation_id TEXT PRIMARY KEY,
+    operation_type TEXT NOT NULL,
+    operand1_entity_id TEXT NOT NULL,
+    operand2_entity_id TEXT NOT NULL,
+    output_entity_id TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    executed_at TEXT NOT NULL,
+    execution_time_ms INTEGER NOT NULL,
+    success BOOLEAN NOT NULL,
+    error_message TEXT,
+    FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id),
+    FOREIGN KEY (operand1_entity_id) REFERENCES entities(entity_id),
+    FOREIGN KEY (operand2_entity_id) REFERENCES entities(entity_id),
+    FOREIGN KEY (output_entity_id) REFERENCES entities(entity_id)
+);
+
+-- Tessellation configs table
+CREATE TABLE IF NOT EXISTS tessellation_configs (
+    config_id TEXT PRIMARY KEY,
+    linear_deflection REAL NOT NULL,
+    angular_deflection REAL NOT NULL,
+    relative BOOLEAN NOT NULL,
+    is_default BOOLEAN NOT NULL
+);
+
+-- Mesh data table
+CREATE TABLE IF NOT EXISTS mesh_data (
+    mesh_id TEXT PRIMARY KEY,
+    entity_id TEXT NOT NULL,
+    triangle_count INTEGER NOT NULL,
+    vertex_count INTEGER NOT NULL,
+    tessellation_config_id TEXT NOT NULL,
+    mesh_size_bytes INTEGER NOT NULL,
+    generated_at TEXT NOT NULL,
+    FOREIGN KEY (entity_id) REFERENCES entities(entity_id),
+    FOREIGN KEY (tessellation_config_id) REFERENCES tessellation_configs(config_id)
+);
+"""
+
+# Indexes are created after the shape_id column migration in initialize_schema
+_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_entities_workspace ON entities(workspace_id);
+CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type);
+CREATE INDEX IF NOT EXISTS idx_entities_agent ON entities(created_by_agent);
+CREATE INDEX IF NOT EXISTS idx_constraints_workspace ON constraints(workspace_id);
+CREATE INDEX IF NOT EXISTS idx_constraints_status ON constraints(satisfaction_status);
+CREATE INDEX IF NOT EXISTS idx_operations_workspace ON operations(workspace_id);
+CREATE INDEX IF NOT EXISTS idx_operations_timestamp ON operations(workspace_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_geometry_shapes_workspace ON geometry_shapes(workspace_id);
+CREATE INDEX IF NOT EXISTS idx_entities_shape ON entities(shape_id);
+-- Composite indexes matching list_entities (type filter, newest first) and
+-- the export keyset pagination, so both seek and return rows already ordered
+CREATE INDEX IF NOT EXISTS idx_entities_ws_type_created ON entities(workspace_id, entity_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_entities_ws_created ON entities(workspace_id, created_at, entity_id);
+"""
+
 
 class Database:
     """SQLite database connection and schema management."""
@@ -27,219 +226,22 @@ class Database:
             self.connection = sqlite3.connect(
                 str(self.db_path),
                 check_same_thread=False,  # Allow multi-threaded access
-                isolation_level="DEFERRED"
+                isolation_level="DEFERRED",
+                cached_statements=512  # Keep hot query plans prepared across calls
             )
             self.connection.row_factory = sqlite3.Row  # Enable dict-like row access
             self.connection.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
             self.connection.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for performance
+            # Checkpoint in small steps to keep the WAL short
+            self.connection.execute("PRAGMA wal_autocheckpoint = 200")
         return self.connection
 
     def initialize_schema(self) -> None:
         """Create all database tables if they don't exist."""
         conn = self.connect()
+        conn.executescript(_SCHEMA_DDL)
         cursor = conn.cursor()
 
-        # Workspaces table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS workspaces (
-                workspace_id TEXT PRIMARY KEY,
-                workspace_name TEXT NOT NULL UNIQUE,
-                workspace_type TEXT NOT NULL CHECK (workspace_type IN ('main', 'agent_branch')),
-                base_workspace_id TEXT,
-                owning_agent_id TEXT,
-                created_at TEXT NOT NULL,
-                entity_count INTEGER DEFAULT 0,
-                operation_count INTEGER DEFAULT 0,
-                branch_status TEXT NOT NULL CHECK (branch_status IN ('clean', 'modified', 'conflicted', 'merged')),
-                divergence_point TEXT,
-                FOREIGN KEY (base_workspace_id) REFERENCES workspaces(workspace_id)
-            )
-        """)
-
-        # Entities table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS entities (
-                entity_id TEXT PRIMARY KEY,
-                entity_type TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                modified_at TEXT NOT NULL,
-                created_by_agent TEXT NOT NULL,
-                parent_entities TEXT,  -- JSON array of entity IDs
-                child_entities TEXT,   -- JSON array of entity IDs
-                properties TEXT NOT NULL,  -- JSON object with entity-specific properties
-                bounding_box TEXT NOT NULL,  -- JSON object {min: [x,y,z], max: [x,y,z]}
-                is_valid INTEGER NOT NULL DEFAULT 1,
-                validation_errors TEXT,  -- JSON array of error codes
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
-            )
-        """)
-
-        # Constraints table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS constraints (
-                constraint_id TEXT PRIMARY KEY,
-                constraint_type TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                constrained_entities TEXT NOT NULL,  -- JSON array of 1-2 entity IDs
-                parameters TEXT,  -- JSON object with constraint-specific parameters
-                satisfaction_status TEXT NOT NULL CHECK (satisfaction_status IN ('satisfied', 'violated', 'redundant')),
-                degrees_of_freedom_removed INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                created_by_agent TEXT NOT NULL,
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
-            )
-        """)
-
-        # Entity-Constraint junction table (many-to-many)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS entity_constraints (
-                entity_id TEXT NOT NULL,
-                constraint_id TEXT NOT NULL,
-                PRIMARY KEY (entity_id, constraint_id),
-                FOREIGN KEY (entity_id) REFERENCES entities(entity_id) ON DELETE CASCADE,
-                FOREIGN KEY (constraint_id) REFERENCES constraints(constraint_id) ON DELETE CASCADE
-            )
-        """)
-
-        # Operations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS operations (
-                operation_id TEXT PRIMARY KEY,
-                operation_type TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                agent_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                input_parameters TEXT NOT NULL,  -- JSON object
-                input_entities TEXT,  -- JSON array of entity IDs
-                output_entities TEXT,  -- JSON array of entity IDs
-                result_status TEXT NOT NULL CHECK (result_status IN ('success', 'error', 'warning')),
-                error_code TEXT,
-                error_message TEXT,
-                execution_time_ms INTEGER NOT NULL,
-                undo_data TEXT,  -- JSON object with undo information
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
-            )
-        """)
-
-        # Validation results table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS validation_results (
-                validation_id TEXT PRIMARY KEY,
-                validation_type TEXT NOT NULL CHECK (validation_type IN ('topology', 'geometry', 'constraints')),
-                checked_entities TEXT NOT NULL,  -- JSON array of entity IDs
-                timestamp TEXT NOT NULL,
-                overall_status TEXT NOT NULL CHECK (overall_status IN ('pass', 'fail', 'warning')),
-                issues TEXT NOT NULL  -- JSON array of issue objects
-            )
-        """)
-
-        # Geometry kernel tables (003-geometry-kernel)
-
-        # Geometry shapes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS geometry_shapes (
-                shape_id TEXT PRIMARY KEY,
-                shape_type TEXT NOT NULL,
-                brep_data TEXT NOT NULL,
-                is_valid BOOLEAN NOT NULL,
-                created_at TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id)
-            )
-        """)
-
-        # Solid properties table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS solid_properties (
-                entity_id TEXT PRIMARY KEY,
-                volume REAL NOT NULL,
-                surface_area REAL NOT NULL,
-                center_of_mass_x REAL NOT NULL,
-                center_of_mass_y REAL NOT NULL,
-                center_of_mass_z REAL NOT NULL,
-                bounding_box_min_x REAL NOT NULL,
-                bounding_box_min_y REAL NOT NULL,
-                bounding_box_min_z REAL NOT NULL,
-                bounding_box_max_x REAL NOT NULL,
-                bounding_box_max_y REAL NOT NULL,
-                bounding_box_max_z REAL NOT NULL,
-                face_count INTEGER NOT NULL,
-                edge_count INTEGER NOT NULL,
-                vertex_count INTEGER NOT NULL,
-                is_closed BOOLEAN NOT NULL,
-                is_manifold BOOLEAN NOT NULL,
-                computed_at TEXT NOT NULL,
-                FOREIGN KEY (entity_id) REFERENCES entities(entity_id)
-            )
-        """)
-
-        # Creation operations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS creation_operations (
-                operation_id TEXT PRIMARY KEY,
-                operation_type TEXT NOT NULL,
-                input_entity_ids TEXT NOT NULL,
-                output_entity_id TEXT NOT NULL,
-                parameters TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                agent_id TEXT NOT NULL,
-                executed_at TEXT NOT NULL,
-                execution_time_ms INTEGER NOT NULL,
-                success BOOLEAN NOT NULL,
-                error_message TEXT,
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id),
-                FOREIGN KEY (output_entity_id) REFERENCES entities(entity_id)
-            )
-        """)
-
-        # Boolean operations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS boolean_operations (
-                operation_id TEXT PRIMARY KEY,
-                operation_type TEXT NOT NULL,
-                operand1_entity_id TEXT NOT NULL,
-                operand2_entity_id TEXT NOT NULL,
-                output_entity_id TEXT NOT NULL,
-                workspace_id TEXT NOT NULL,
-                agent_id TEXT NOT NULL,
-                executed_at TEXT NOT NULL,
-                execution_time_ms INTEGER NOT NULL,
-                success BOOLEAN NOT NULL,
-                error_message TEXT,
-                FOREIGN KEY (workspace_id) REFERENCES workspaces(workspace_id),
-                FOREIGN KEY (operand1_entity_id) REFERENCES entities(entity_id),
-                FOREIGN KEY (operand2_entity_id) REFERENCES entities(entity_id),
-                FOREIGN KEY (output_entity_id) REFERENCES entities(entity_id)
-            )
-        """)
-
-        # Tessellation configs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tessellation_configs (
-                config_id TEXT PRIMARY KEY,
-                linear_deflection REAL NOT NULL,
-                angular_deflection REAL NOT NULL,
-                relative BOOLEAN NOT NULL,
-                is_default BOOLEAN NOT NULL
-            )
-        """)
-
-        # Mesh data table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mesh_data (
-                mesh_id TEXT PRIMARY KEY,
-                entity_id TEXT NOT NULL,
-                triangle_count INTEGER NOT NULL,
-                vertex_count INTEGER NOT NULL,
-                tessellation_config_id TEXT NOT NULL,
-                mesh_size_bytes INTEGER NOT NULL,
-                generated_at TEXT NOT NULL,
-                FOREIGN KEY (entity_id) REFERENCES entities(entity_id),
-                FOREIGN KEY (tessellation_config_id) REFERENCES tessellation_configs(config_id)
-            )
-        """)
-
         # Add shape_id column to entities table if it doesn't exist
         # Check if column exists first
         cursor.execute("PRAGMA table_info(entities)")
@@ -260,18 +262,8 @@ class Database:
                 ('high_quality', 0.01, 0.1, 0, 0)
             """)
 
-        # Create indexes for performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_workspace ON entities(workspace_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_agent ON entities(created_by_agent)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_constraints_workspace ON constraints(workspace_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_constraints_status ON constraints(satisfaction_status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_operations_workspace ON operations(workspace_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_operations_timestamp ON operations(workspace_id, timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_geometry_shapes_workspace ON geometry_shapes(workspace_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_shape ON entities(shape_id)")
-
         conn.commit()
+        conn.executescript(_INDEX_DDL)
 
     def get_geometry_shape(self, shape_id: str):
         """Retrieve a geometry shape from the database.
@@ -360,6 +352,25 @@ class Database:
             props.computed_at
         ))
 
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Copy committed WAL frames back into the database file.
+
+        Args:
+            mode: Checkpoint mode (PASSIVE, FULL, RESTART or TRUNCATE)
+
+        Returns:
+            Tuple of (busy, wal_frames, checkpointed_frames) reported by SQLite
+
+        Raises:
+            ValueError: If mode is not a valid checkpoint mode
+        """
+        mode = mode.upper()
+        if mode not in _CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+
+        row = self.connect().execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return tuple(row)
+
     def close(self) -> None:
         """Close database connection."""
         if self.connection:
@@ -1,11 +1,25 @@
 """Entity metadata persistence layer."""
 import json
 import sqlite3
-from datetime import datetime, timezone
-from typing import Any, Optional
+from collections import Counter
+from typing import Any, Iterable, Optional
 
+from ..utils.timestamps import utc_now_iso
 from .database import Database
 
+# Positional fields accepted by EntityStore.create_entities_bulk
+EntityRow = tuple[
+    str,  # entity_id
+    str,  # entity_type
+    str,  # workspace_id
+    str,  # created_by_agent
+    dict[str, Any],  # properties
+    dict[str, list[float]],  # bounding_box
+    Optional[list[str]],  # parent_entities
+    bool,  # is_valid
+    Optional[list[str]],  # validation_errors
+]
+
 
 class EntityStore:
     """Manage entity metadata persistence in SQLite."""
@@ -43,39 +57,85 @@ class EntityStore:
             is_valid: Topology/geometry validity status
             validation_errors: List of error codes if invalid (optional)
         """
-        now = datetime.now(timezone.utc).isoformat()
-        conn = self.database.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO entities (
-                entity_id, entity_type, workspace_id, created_at, modified_at,
-                created_by_agent, parent_entities, child_entities, properties,
-                bounding_box, is_valid, validation_errors
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.create_entities_bulk([(
             entity_id,
             entity_type,
             workspace_id,
-            now,
-            now,
             created_by_agent,
-            json.dumps(parent_entities or []),
-            json.dumps([]),  # Empty child_entities initially
-            json.dumps(properties),
-            json.dumps(bounding_box),
-            1 if is_valid else 0,
-            json.dumps(validation_errors or [])
-        ))
-        conn.commit()
+            properties,
+            bounding_box,
+            parent_entities,
+            is_valid,
+            validation_errors
+        )])
+        # Single creates have always committed, including an implicit
+        # transaction the connection already had open
+        self.database.connect().commit()
+
+    def create_entities_bulk(self, entities: Iterable[EntityRow]) -> None:
+        """Create many entities in a single transaction.
+
+        If the caller already has a transaction open, the batch joins it and
+        committing or rolling back is left to the caller.
 
-        # Update workspace entity count
-        cursor.execute("""
-            UPDATE workspaces
-            SET entity_count = entity_count + 1
-            WHERE workspace_id = ?
-        """, (workspace_id,))
-        conn.commit()
+        Args:
+            entities: Tuples of (entity_id, entity_type, workspace_id,
+                created_by_agent, properties, bounding_box, parent_entities,
+                is_valid, validation_errors), in create_entity's argument order
+        """
+        now = utc_now_iso()
+        empty_list = json.dumps([])
+        workspace_counts: Counter[str] = Counter()
+
+        rows = []
+        for (entity_id, entity_type, workspace_id, created_by_agent, properties,
+             bounding_box, parent_entities, is_valid, validation_errors) in entities:
+            rows.append((
+                entity_id,
+                entity_type,
+                workspace_id,
+                now,
+                now,
+                created_by_agent,
+                json.dumps(parent_entities or []),
+                empty_list,  # Empty child_entities initially
+                json.dumps(properties),
+                json.dumps(bounding_box),
+                1 if is_valid else 0,
+                json.dumps(validation_errors or [])
+            ))
+            workspace_counts[workspace_id] += 1
+
+        if not rows:
+            return
+
+        conn = self.database.connect()
+        # Take the write lock up front; join a transaction the caller already opened
+        owns_transaction = not conn.in_transaction
+        if owns_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO entities (
+                    entity_id, entity_type, workspace_id, created_at, modified_at,
+                    created_by_agent, parent_entities, child_entities, properties,
+                    bounding_box, is_valid, validation_errors
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+            # Update workspace entity counts, one statement per workspace
+            cursor.executemany("""
+                UPDATE workspaces
+                SET entity_count = entity_count + ?
+                WHERE workspace_id = ?
+            """, [(count, workspace_id) for workspace_id, count in workspace_counts.items()])
+        except sqlite3.Error:
+            if owns_transaction:
+                conn.rollback()
+            raise
+        if owns_transaction:
+            conn.commit()
 
     def get_entity(self, entity_id: str) -> Optional[dict[str, Any]]:
         """Retrieve entity by ID.
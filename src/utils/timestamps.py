@@ -0,0 +1,39 @@
+"""Shared UTC ISO-8601 timestamps.
+
+Inside a request_timestamp() block every utc_now_iso() call returns the same
+string, so a request that creates many entities formats the clock once and
+all of its rows carry one consistent timestamp.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+_request_timestamp: ContextVar[Optional[str]] = ContextVar("request_timestamp", default=None)
+
+
+def utc_now_iso() -> str:
+    """Get the current UTC time as an ISO-8601 string.
+
+    Returns:
+        The enclosing request's timestamp, or a fresh one outside a request
+    """
+    timestamp = _request_timestamp.get()
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+    return timestamp
+
+
+@contextmanager
+def request_timestamp() -> Iterator[str]:
+    """Pin utc_now_iso() to a single timestamp for the duration of the block.
+
+    Yields:
+        The shared ISO-8601 timestamp
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    token = _request_timestamp.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _request_timestamp.reset(token)
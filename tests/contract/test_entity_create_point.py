@@ -172,3 +172,52 @@ def test_create_point_missing_params():
     error = response["error"]
     assert error["code"] == -32602  # INVALID_PARAMETER
     assert "coordinates" in error["message"].lower()
+
+
+def test_create_points_batch_success():
+    """Test creating several points in one entity.create.points request."""
+    request = {
+        "jsonrpc": "2.0",
+        "method": "entity.create.points",
+        "params": {
+            "points": [[1.0, 2.0], [3.0, 4.0, 5.0], [6.0, 7.0]]
+        },
+        "id": 7
+    }
+
+    response = call_cli(request)
+
+    assert response["id"] == 7
+    data = response["result"]["data"]
+    entities = data["entities"]
+    assert [entity["coordinates"] for entity in entities] == [
+        [1.0, 2.0, 0.0], [3.0, 4.0, 5.0], [6.0, 7.0, 0.0]
+    ]
+    assert all(entity["entity_id"].startswith("main:point_") for entity in entities)
+    assert len({entity["entity_id"] for entity in entities}) == 3
+
+    # Every point is queryable afterwards
+    query = call_cli({
+        "jsonrpc": "2.0",
+        "method": "entity.query",
+        "params": {"entity_id": entities[1]["entity_id"]},
+        "id": 8
+    })
+    assert query["result"]["data"]["coordinates"] == [3.0, 4.0, 5.0]
+
+
+def test_create_points_batch_rejects_invalid_point():
+    """Test one invalid point fails the whole batch before anything is created."""
+    request = {
+        "jsonrpc": "2.0",
+        "method": "entity.create.points",
+        "params": {
+            "points": [[1.0, 2.0], [1e10, 0.0]]
+        },
+        "id": 9
+    }
+
+    response = call_cli(request)
+
+    assert "error" in response
+    assert "result" not in response
@@ -9,6 +9,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def call_cli(request: dict) -> dict:
     """Helper to call CLI with JSON-RPC request."""
@@ -75,6 +77,69 @@ def test_file_export_json_success():
     assert "file_size" in data
 
 
+def test_file_export_json_async_write(tmp_path):
+    """Test background JSON export is flushed to disk before CLI exits."""
+    call_cli({
+        "jsonrpc": "2.0",
+        "method": "entity.create.point",
+        "params": {"coordinates": [1.0, 2.0]},
+        "id": 1
+    })
+
+    output_path = tmp_path / "async_output.json"
+    response = call_cli({
+        "jsonrpc": "2.0",
+        "method": "file.export",
+        "params": {
+            "file_path": str(output_path),
+            "format": "json",
+            "async_write": True
+        },
+        "id": 2
+    })
+
+    data = response["result"]["data"]
+    assert output_path.exists()
+    assert output_path.stat().st_size == data["file_size"]
+    assert json.loads(output_path.read_text())["entity_count"] >= 1
+
+
+def test_file_export_json_async_write_failure(tmp_path):
+    """Test a failed background write is reported by the next file.flush."""
+    # Writing over an existing directory fails on the writer thread
+    output_path = tmp_path / "occupied.json"
+    output_path.mkdir()
+
+    # Both requests go to one CLI process, which owns the writer
+    requests = [
+        {
+            "jsonrpc": "2.0",
+            "method": "file.export",
+            "params": {
+                "file_path": str(output_path),
+                "format": "json",
+                "async_write": True
+            },
+            "id": 1
+        },
+        {"jsonrpc": "2.0", "method": "file.flush", "params": {}, "id": 2},
+    ]
+    result = subprocess.run(
+        [sys.executable, "-m", "src.agent_interface.cli"],
+        input="".join(json.dumps(request) + "\n" for request in requests),
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent.parent
+    )
+    export_response, flush_response = [json.loads(line) for line in result.stdout.splitlines()]
+
+    # The export returns once the bytes are queued
+    assert export_response["result"]["data"]["write_pending"] is True
+
+    assert "error" in flush_response
+    assert "occupied.json" in flush_response["error"]["message"]
+
+
 def test_file_export_stl_success():
     """Test exporting solid to STL format."""
     # Create a cylinder
@@ -119,6 +184,44 @@ def test_file_export_stl_success():
     assert data["triangle_count"] > 0
 
 
+def test_file_export_step_reexport_hits_cache(tmp_path):
+    """Test re-exporting unchanged solids is served from the export cache."""
+    pytest.importorskip("OCC")
+
+    circle_response = call_cli({
+        "jsonrpc": "2.0",
+        "method": "entity.create.circle",
+        "params": {"center": [0.0, 0.0], "radius": 3.0},
+        "id": 1
+    })
+    circle_id = circle_response["result"]["data"]["entity_id"]
+
+    extrude_response = call_cli({
+        "jsonrpc": "2.0",
+        "method": "solid.extrude",
+        "params": {"entity_ids": [circle_id], "distance": 4.0},
+        "id": 2
+    })
+    solid_id = extrude_response["result"]["data"]["entity_id"]
+
+    def export(name: str, schema: str) -> dict:
+        return call_cli({
+            "jsonrpc": "2.0",
+            "method": "file.export",
+            "params": {
+                "file_path": str(tmp_path / name),
+                "format": "step",
+                "entity_ids": [solid_id],
+                "schema": schema
+            },
+            "id": 3
+        })["result"]["data"]
+
+    assert export("first.step", "AP214")["cache_hit"] is False
+    assert export("second.step", "AP214")["cache_hit"] is True
+    assert export("third.step", "AP242")["cache_hit"] is False
+
+
 def test_file_export_missing_params():
     """Test export with missing parameters."""
     request = {
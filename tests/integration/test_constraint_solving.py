@@ -15,8 +15,10 @@ from src.operations.constraints import (
     PerpendicularConstraint,
     DistanceConstraint,
     AngleConstraint,
+    TangentConstraint,
+    evaluate_constraints,
 )
-from src.operations.primitives_2d import Line2D, Point2D
+from src.operations.primitives_2d import Circle2D, Line2D, Point2D
 
 
 def generate_entity_id(entity_type: str) -> str:
@@ -214,6 +216,31 @@ class TestDistanceConstraint:
         assert abs(error) > 4.0  # Off by ~5.0
 
 
+    def test_distance_constraint_follows_entity_changes(self):
+        """Test replacing the entities (or one of them) is picked up by later checks."""
+        origin = Point2D(entity_id=generate_entity_id("point"), workspace_id="main", coordinates=[0.0, 0.0])
+        near = Point2D(entity_id=generate_entity_id("point"), workspace_id="main", coordinates=[3.0, 4.0])
+        constraint = DistanceConstraint(
+            constraint_id=generate_entity_id("constraint"),
+            workspace_id="main",
+            entity_ids=[origin.entity_id, near.entity_id],
+            entities=[origin, near],
+            target_distance=5.0
+        )
+        assert constraint.check_satisfaction()[0]
+
+        # A line measures from its start point
+        line = Line2D(entity_id=generate_entity_id("line"), workspace_id="main", start=[0.0, 5.0], end=[1.0, 5.0])
+        constraint.entities[1] = line
+        assert constraint.check_satisfaction()[0]
+
+        far = Point2D(entity_id=generate_entity_id("point"), workspace_id="main", coordinates=[10.0, 0.0])
+        constraint.entities = [origin, far]
+        is_satisfied, error = constraint.check_satisfaction()
+        assert not is_satisfied
+        assert abs(error - 5.0) < 1e-6
+
+
 class TestAngleConstraint:
     """Test angle constraint solving."""
 
@@ -249,6 +276,59 @@ class TestAngleConstraint:
         assert abs(error) < 0.01  # Within 0.01 radians
 
 
+class TestTangentConstraint:
+    """Test tangent constraint solving."""
+
+    def test_tangent_constraint_follows_entity_changes(self):
+        """Test reassigned entities are re-resolved into line and circle."""
+        line = Line2D(entity_id=generate_entity_id("line"), workspace_id="main", start=[-10.0, 5.0], end=[10.0, 5.0])
+        circle = Circle2D(entity_id=generate_entity_id("circle"), workspace_id="main", center=[0.0, 0.0], radius=5.0)
+        constraint = TangentConstraint(
+            constraint_id=generate_entity_id("constraint"),
+            workspace_id="main",
+            entity_ids=[line.entity_id, circle.entity_id],
+            entities=[line, circle]
+        )
+        assert constraint.check_satisfaction()[0]
+
+        larger = Circle2D(entity_id=generate_entity_id("circle"), workspace_id="main", center=[0.0, 0.0], radius=8.0)
+        constraint.entities = [larger, line]
+        is_satisfied, error = constraint.check_satisfaction()
+        assert not is_satisfied
+        assert abs(error - 3.0) < 1e-6
+
+
+class TestConstraintEvaluation:
+    """Test evaluating groups of constraints."""
+
+    def test_evaluate_constraints_matches_individual_checks(self):
+        """Test batch evaluation agrees with check_satisfaction and sets status."""
+        horizontal = Line2D(entity_id=generate_entity_id("line"), workspace_id="main",
+                            start=[0.0, 0.0], end=[10.0, 0.0])
+        vertical = Line2D(entity_id=generate_entity_id("line"), workspace_id="main",
+                          start=[0.0, 0.0], end=[0.0, 10.0])
+        diagonal = Line2D(entity_id=generate_entity_id("line"), workspace_id="main",
+                          start=[0.0, 0.0], end=[10.0, 10.0])
+        point1 = Point2D(entity_id=generate_entity_id("point"), workspace_id="main",
+                         coordinates=[0.0, 0.0])
+        point2 = Point2D(entity_id=generate_entity_id("point"), workspace_id="main",
+                         coordinates=[3.0, 4.0])
+
+        constraints = [
+            PerpendicularConstraint(constraint_id="c1", workspace_id="main",
+                                    entity_ids=[], entities=[horizontal, vertical]),
+            ParallelConstraint(constraint_id="c2", workspace_id="main",
+                               entity_ids=[], entities=[horizontal, diagonal]),
+            DistanceConstraint(constraint_id="c3", workspace_id="main",
+                               entity_ids=[], entities=[point1, point2], target_distance=5.0),
+        ]
+
+        errors = evaluate_constraints(constraints)
+
+        assert errors == [c.check_satisfaction()[1] for c in constraints]
+        assert [c.satisfaction_status for c in constraints] == ["satisfied", "violated", "satisfied"]
+
+
 class TestConstraintConflictDetection:
     """Test constraint conflict detection."""
 
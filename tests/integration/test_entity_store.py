@@ -0,0 +1,147 @@
+"""Integration tests for bulk entity persistence.
+
+NO MOCKS - Real SQLite database only.
+"""
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.persistence.database import Database
+from src.persistence.entity_store import EntityStore
+
+
+@pytest.fixture
+def test_database(tmp_path):
+    """Create test database with schema."""
+    db = Database(tmp_path / "test_entities.db")
+    db.initialize_schema()
+    with db.connect() as conn:
+        conn.execute("""
+            INSERT INTO workspaces (workspace_id, workspace_name, workspace_type, created_at, branch_status)
+            VALUES ('main', 'main', 'main', '2025-01-01T00:00:00+00:00', 'clean')
+        """)
+    yield db
+    db.close()
+
+
+def test_checkpoint_truncates_wal(test_database):
+    """Test a TRUNCATE checkpoint flushes every WAL frame."""
+    busy, _, _ = test_database.checkpoint("truncate")
+
+    assert busy == 0
+    assert test_database.checkpoint() == (0, 0, 0)
+
+
+def test_serve_shutdown_truncates_wal(tmp_path):
+    """Test a CLI worker checkpoints its workspace WAL when it shuts down."""
+    # Another open connection (e.g. a second worker) keeps SQLite from
+    # checkpointing and removing the WAL when the worker disconnects
+    other = Database(tmp_path / "database.db")
+    other.initialize_schema()
+    try:
+        request = {"jsonrpc": "2.0", "method": "entity.create.point", "params": {"coordinates": [1.0, 2.0]}, "id": 1}
+        result = subprocess.run(
+            [sys.executable, "-m", "src.agent_interface.cli", "--serve"],
+            input=json.dumps(request) + "\n",
+            capture_output=True,
+            text=True,
+            env={**os.environ, "MULTI_AGENT_WORKSPACE_DIR": str(tmp_path)},
+            cwd=Path(__file__).parent.parent.parent
+        )
+        assert "result" in json.loads(result.stdout)
+
+        assert (tmp_path / "database.db-wal").stat().st_size == 0
+    finally:
+        other.close()
+
+
+def test_checkpoint_rejects_unknown_mode(test_database):
+    """Test checkpoint validates the mode before building the PRAGMA."""
+    with pytest.raises(ValueError, match="Invalid checkpoint mode"):
+        test_database.checkpoint("NOW); DROP TABLE entities; --")
+
+
+def test_create_entities_bulk_updates_workspace_count(test_database):
+    """Test bulk creation stores all entities and bumps the workspace count once."""
+    store = EntityStore(test_database)
+    store.create_entities_bulk([
+        (f"main:point_{i}", "point", "main", "agent",
+         {"coordinates": [i, 0, 0]}, {"min": [i, 0, 0], "max": [i, 0, 0]},
+         None, True, None)
+        for i in range(10)
+    ])
+    store.create_entity(
+        entity_id="main:line_0",
+        entity_type="line",
+        workspace_id="main",
+        created_by_agent="agent",
+        properties={"start": [0, 0, 0], "end": [1, 1, 0]},
+        bounding_box={"min": [0, 0, 0], "max": [1, 1, 0]}
+    )
+
+    _, total = store.list_entities("main", limit=100)
+    assert total == 11
+    assert store.get_entity("main:point_3")["properties"] == {"coordinates": [3, 0, 0]}
+
+    cursor = test_database.connect().execute("SELECT entity_count FROM workspaces WHERE workspace_id = 'main'")
+    assert cursor.fetchone()[0] == 11
+
+
+def test_create_entities_bulk_is_atomic(test_database):
+    """Test a failing row rolls back the whole batch."""
+    store = EntityStore(test_database)
+    rows = [
+        ("main:point_dup", "point", "main", "agent", {}, {"min": [0, 0, 0], "max": [0, 0, 0]}, None, True, None)
+    ] * 2
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.create_entities_bulk(rows)
+
+    assert store.get_entity("main:point_dup") is None
+
+
+def test_create_entities_bulk_joins_caller_transaction(test_database):
+    """Test the batch joins an open transaction and the caller's rollback undoes it."""
+    store = EntityStore(test_database)
+    conn = test_database.connect()
+    conn.execute("""
+        INSERT INTO workspaces (workspace_id, workspace_name, workspace_type, created_at, branch_status)
+        VALUES ('branch', 'branch', 'agent_branch', '2025-01-01T00:00:00+00:00', 'clean')
+    """)
+    assert conn.in_transaction
+
+    store.create_entities_bulk([
+        ("main:point_tx", "point", "main", "agent", {}, {"min": [0, 0, 0], "max": [0, 0, 0]}, None, True, None)
+    ])
+    assert conn.in_transaction
+
+    conn.rollback()
+
+    assert store.get_entity("main:point_tx") is None
+    assert conn.execute("SELECT COUNT(*) FROM workspaces WHERE workspace_id = 'branch'").fetchone()[0] == 0
+    assert conn.execute("SELECT entity_count FROM workspaces WHERE workspace_id = 'main'").fetchone()[0] == 0
+
+
+def test_create_entity_commits_open_transaction(test_database):
+    """Test create_entity still commits when the connection has a transaction open."""
+    store = EntityStore(test_database)
+    conn = test_database.connect()
+    conn.execute("UPDATE workspaces SET workspace_name = 'renamed' WHERE workspace_id = 'main'")
+    assert conn.in_transaction
+
+    store.create_entity("main:point_0", "point", "main", "agent", {}, {"min": [0, 0, 0], "max": [0, 0, 0]})
+    assert not conn.in_transaction
+
+    # Both writes are visible from a separate connection
+    other = sqlite3.connect(test_database.db_path)
+    try:
+        assert other.execute("SELECT COUNT(*) FROM entities").fetchone()[0] == 1
+        assert other.execute("SELECT workspace_name FROM workspaces").fetchone()[0] == "renamed"
+    finally:
+        other.close()
+
@@ -0,0 +1,154 @@
+"""Integration tests for ExportManager with real geometry and SQLite.
+
+These tests require pythonOCC to be installed (use cad-geo conda environment).
+
+NO MOCKS - Real OCCT and SQLite only.
+"""
+import json
+
+import pytest
+
+from src.persistence.database import Database
+
+# Import geometry kernel modules (will only work if pythonOCC is installed)
+try:
+    from src.cad_kernel.primitive_ops import create_box
+    from src.file_io.export_manager import ExportManager
+    PYTHONOCC_AVAILABLE = True
+except ImportError:
+    PYTHONOCC_AVAILABLE = False
+
+# Skip all tests if pythonOCC is not available
+pytestmark = pytest.mark.skipif(
+    not PYTHONOCC_AVAILABLE,
+    reason="pythonOCC not installed in environment. Run: conda activate cad-geo"
+)
+
+
+@pytest.fixture
+def test_database(tmp_path):
+    """Create test database with schema and a main workspace."""
+    db = Database(tmp_path / "test_export.db")
+    db.initialize_schema()
+    with db.connect() as conn:
+        conn.execute("""
+            INSERT INTO workspaces (workspace_id, workspace_name, workspace_type, created_at, branch_status)
+            VALUES ('main', 'main', 'main', '2025-01-01T00:00:00+00:00', 'clean')
+        """)
+    yield db
+    db.close()
+
+
+def store_box(db: Database, entity_id: str, width: float, created_at: str) -> None:
+    """Helper to create a box and persist its entity and geometry rows."""
+    geo_shape, _ = create_box(width=width, depth=10.0, height=10.0, workspace_id="main")
+    conn = db.connect()
+    db.save_geometry_shape(geo_shape)
+    conn.execute("""
+        INSERT INTO entities (
+            entity_id, entity_type, workspace_id, created_at, modified_at, created_by_agent,
+            parent_entities, child_entities, properties, bounding_box, is_valid, validation_errors, shape_id
+        ) VALUES (?, 'solid', 'main', ?, ?, 'agent', '[]', '[]', '{}', ?, 1, '[]', ?)
+    """, (
+        entity_id, created_at, created_at,
+        json.dumps({"min": [0, 0, 0], "max": [width, 10.0, 10.0]}),
+        geo_shape.shape_id
+    ))
+    conn.commit()
+
+
+def test_export_workspace_spans_multiple_batches(test_database, tmp_path):
+    """Test workspace export loads every keyset page of solids."""
+    for i in range(5):
+        store_box(test_database, f"main:solid_{i}", 10.0 + i, f"2025-01-01T00:00:0{i}+00:00")
+
+    manager = ExportManager(test_database.connect())
+    manager.WORKSPACE_BATCH_SIZE = 2
+
+    result = manager.export_workspace("main", str(tmp_path / "workspace.step"), "step")
+
+    assert result["entity_count"] == 5
+    assert result["file_size"] > 0
+
+
+def test_export_workspace_without_solids_raises(test_database, tmp_path):
+    """Test exporting an empty workspace is rejected."""
+    manager = ExportManager(test_database.connect())
+
+    with pytest.raises(ValueError, match="No solids found"):
+        manager.export_workspace("main", str(tmp_path / "empty.step"), "step")
+
+
+def test_export_cache_hit_on_unchanged_reexport(test_database, tmp_path):
+    """Test exporting the same shapes twice is served from the cache."""
+    store_box(test_database, "main:solid_0", 10.0, "2025-01-01T00:00:00+00:00")
+    manager = ExportManager(test_database.connect(), cache_dir=tmp_path / "cache")
+
+    first = manager.export_entities(["main:solid_0"], str(tmp_path / "first.step"), "step", "main")
+    second = manager.export_entities(["main:solid_0"], str(tmp_path / "second.step"), "step", "main")
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True
+    assert (tmp_path / "second.step").read_bytes() == (tmp_path / "first.step").read_bytes()
+
+
+def test_export_cache_unaffected_by_editing_export(test_database, tmp_path):
+    """Test editing an exported file does not alter later cache hits."""
+    store_box(test_database, "main:solid_0", 10.0, "2025-01-01T00:00:00+00:00")
+    manager = ExportManager(test_database.connect(), cache_dir=tmp_path / "cache")
+
+    manager.export_entities(["main:solid_0"], str(tmp_path / "first.step"), "step", "main")
+    original = (tmp_path / "first.step").read_bytes()
+    with open(tmp_path / "first.step", "ab") as f:
+        f.write(b"edited")
+
+    second = manager.export_entities(["main:solid_0"], str(tmp_path / "second.step"), "step", "main")
+
+    assert second["cache_hit"] is True
+    assert (tmp_path / "second.step").read_bytes() == original
+
+
+@pytest.mark.parametrize("format, first_options, second_options", [
+    ("step", {"schema": "AP214"}, {"schema": "AP203"}),
+    ("stl", {"ascii": False}, {"ascii": True}),
+    ("stl", {"tessellation_quality": "standard"}, {"tessellation_quality": "high_quality"}),
+])
+def test_export_cache_misses_on_changed_option(
+    test_database, tmp_path, format, first_options, second_options
+):
+    """Test a changed format option is keyed separately in the cache."""
+    store_box(test_database, "main:solid_0", 10.0, "2025-01-01T00:00:00+00:00")
+    manager = ExportManager(test_database.connect(), cache_dir=tmp_path / "cache")
+
+    first = manager.export_entities(
+        ["main:solid_0"], str(tmp_path / f"first.{format}"), format, "main", **first_options
+    )
+    second = manager.export_entities(
+        ["main:solid_0"], str(tmp_path / f"second.{format}"), format, "main", **second_options
+    )
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is False
+
+
+def test_export_cache_misses_on_changed_shape(test_database, tmp_path):
+    """Test re-exporting an entity whose shape was replaced bypasses the cache."""
+    store_box(test_database, "main:solid_0", 10.0, "2025-01-01T00:00:00+00:00")
+    manager = ExportManager(test_database.connect(), cache_dir=tmp_path / "cache")
+
+    first = manager.export_entities(["main:solid_0"], str(tmp_path / "first.step"), "step", "main")
+
+    # Point the entity at a new, larger shape
+    geo_shape, _ = create_box(width=20.0, depth=10.0, height=10.0, workspace_id="main")
+    conn = test_database.connect()
+    test_database.save_geometry_shape(geo_shape)
+    conn.execute(
+        "UPDATE entities SET shape_id = ? WHERE entity_id = ?",
+        (geo_shape.shape_id, "main:solid_0")
+    )
+    conn.commit()
+
+    second = manager.export_entities(["main:solid_0"], str(tmp_path / "second.step"), "step", "main")
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is False
@@ -132,6 +132,25 @@ class TestLineCreation:
         assert valid
         assert error is None
 
+    def test_line_2d_endpoint_change_updates_cached_geometry(self):
+        """Test reassigned or edited endpoints are reflected in length and direction."""
+        line = Line2D(
+            entity_id=generate_entity_id("line"),
+            workspace_id="main",
+            start=[0.0, 0.0],
+            end=[10.0, 0.0]
+        )
+        assert line.length == 10.0
+
+        line.end = [0.0, 5.0, 0.0]
+        assert line.length == 5.0
+        assert line.direction_vector == [0.0, 1.0, 0.0]
+
+        # In-place edits need an explicit invalidation
+        line.end[1] = 2.0
+        line._invalidate_cache()
+        assert line.length == 2.0
+
     def test_create_line_3d(self):
         """Test 3D line creation, length, and direction_vector verification."""
         line = Line3D(
@@ -0,0 +1,45 @@
+"""Integration tests for the per-workspace undo/redo history.
+
+NO MOCKS - Real OperationHistory only.
+"""
+from src.operations.history import HistoryEntry, OperationHistory
+
+
+def make_entry(operation_id: str) -> HistoryEntry:
+    """Helper to build a minimal history entry."""
+    return HistoryEntry(
+        operation_id=operation_id,
+        operation_type="entity.create.point",
+        workspace_id="main",
+        timestamp="2025-01-01T00:00:00+00:00",
+        params={},
+        result={}
+    )
+
+
+class TestOperationHistory:
+    """Test history trimming and redo truncation."""
+
+    def test_oldest_operations_dropped_past_max_history(self):
+        """Test history keeps only the newest max_history operations."""
+        history = OperationHistory("main", max_history=3)
+        for i in range(5):
+            history.add_operation(make_entry(f"op_{i}"))
+
+        assert history.get_total_count() == 3
+        assert history.get_current_position() == 2
+        assert [op["operation_id"] for op in history.list_operations()] == ["op_4", "op_3", "op_2"]
+
+    def test_add_after_undo_discards_redo_operations(self):
+        """Test adding an operation after undo truncates the undone ones."""
+        history = OperationHistory("main")
+        for i in range(3):
+            history.add_operation(make_entry(f"op_{i}"))
+
+        history.mark_undo_complete()
+        history.mark_undo_complete()
+        history.add_operation(make_entry("op_new"))
+
+        assert not history.can_redo()
+        assert history.get_current_position() == 1
+        assert [op["operation_id"] for op in history.list_operations(include_future=True)] == ["op_new", "op_0"]
@@ -9,7 +9,7 @@ import math
 import uuid
 import pytest
 
-from src.operations.solid_modeling import SolidBody, Topology
+from src.operations.solid_modeling import SolidBody, Topology, boolean_operation
 
 
 def generate_entity_id(entity_type: str) -> str:
@@ -18,6 +18,26 @@ def generate_entity_id(entity_type: str) -> str:
     return f"main:{entity_type}_{unique_id}"
 
 
+def make_box(min_corner: list[float], max_corner: list[float]) -> SolidBody:
+    """Helper to build an axis-aligned box solid with its bounding box."""
+    width, height, depth = (b - a for a, b in zip(min_corner, max_corner))
+    return SolidBody(
+        entity_id=generate_entity_id("solid"),
+        workspace_id="main",
+        volume=width * height * depth,
+        surface_area=2 * (width * height + width * depth + height * depth),
+        center_of_mass=[(a + b) / 2 for a, b in zip(min_corner, max_corner)],
+        topology=Topology(
+            face_count=6,
+            edge_count=12,
+            vertex_count=8,
+            is_closed=True,
+            is_manifold=True
+        ),
+        bounding_box={"min": min_corner, "max": max_corner}
+    )
+
+
 class TestExtrudeOperation:
     """Test extrude operations with real geometry."""
 
@@ -199,6 +219,26 @@ class TestBooleanIntersect:
         assert abs(solid.volume - 500.0) < 10.0
         assert solid.topology.is_closed
 
+    def test_intersect_boxes_is_exact_overlap(self):
+        """Test box-box intersection returns the exact overlap box."""
+        box1 = make_box([0.0, 0.0, 0.0], [10.0, 10.0, 10.0])
+        box2 = make_box([5.0, 0.0, 0.0], [15.0, 10.0, 10.0])
+
+        result = boolean_operation("intersect", [box1, box2], "main")
+
+        assert result.volume == 500.0
+        assert result.surface_area == 400.0
+        assert result.center_of_mass == [7.5, 5.0, 5.0]
+        assert result.bounding_box == {"min": [5.0, 0.0, 0.0], "max": [10.0, 10.0, 10.0]}
+
+    def test_intersect_disjoint_boxes_raises(self):
+        """Test intersecting non-overlapping boxes is rejected."""
+        box1 = make_box([0.0, 0.0, 0.0], [10.0, 10.0, 10.0])
+        box2 = make_box([20.0, 0.0, 0.0], [30.0, 10.0, 10.0])
+
+        with pytest.raises(ValueError, match="do not overlap"):
+            boolean_operation("intersect", [box1, box2], "main")
+
 
 class TestTopologyValidation:
     """Test topology validation."""
@@ -192,3 +192,37 @@ def test_create_multiple_agents(controller, cleanup_workspace):
     assert len(controller.agents) == 3
     for agent_id, _, _ in agents_data:
         assert agent_id in controller.agents
+
+
+def test_create_agents_batch(controller, cleanup_workspace):
+    """
+    Test creating several agents in one call.
+
+    Verifies missing workspaces are created in one batch and every agent is
+    registered with a message queue.
+    """
+    agents_data = [
+        ("designer_batch_001", "designer", "test_ws_batch_001"),
+        ("modeler_batch_001", "modeler", "test_ws_batch_002"),
+        ("validator_batch_001", "validator", "test_ws_batch_002"),
+    ]
+
+    for workspace_id in ["test_ws_batch_001", "test_ws_batch_002"]:
+        cleanup_workspace.append(workspace_id)
+
+    agents = controller.create_agents(agents_data)
+
+    assert [agent.agent_id for agent in agents] == [data[0] for data in agents_data]
+    for agent_id, role_name, workspace_id in agents_data:
+        assert controller.agents[agent_id].role.name == role_name
+        assert controller.agents[agent_id].workspace_id == workspace_id
+        assert agent_id in controller.message_queues
+
+    list_result = controller._execute_cli_command("workspace.list", {})
+    names = [ws["workspace_name"] for ws in list_result["data"]["workspaces"]]
+    assert names.count("test_ws_batch_001") == 1
+    assert names.count("test_ws_batch_002") == 1
+
+    # Duplicate IDs are rejected before anything is created
+    with pytest.raises(ValueError, match="already exists"):
+        controller.create_agents([("designer_batch_001", "designer", "test_ws_batch_003")])
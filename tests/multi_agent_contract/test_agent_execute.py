@@ -118,6 +118,31 @@ def test_execute_multiple_operations_updates_metrics(controller, cleanup_workspa
     assert len(agent.created_entities) == 3
 
 
+def test_execute_operation_in_process(cleanup_workspace):
+    """
+    Test in-process dispatch returns the same result shape as CLI workers.
+    """
+    ctrl = Controller(controller_id="test_controller_inproc", in_process=True)
+    try:
+        ctrl.role_templates = load_predefined_roles()
+    except FileNotFoundError:
+        pytest.skip("Role templates not found")
+
+    workspace_id = "test_ws_exec_inproc"
+    cleanup_workspace.append(workspace_id)
+
+    ctrl.create_agent("inproc_agent", "designer", workspace_id)
+    result = ctrl.execute_operation(
+        "inproc_agent",
+        "entity.create_point",
+        {"x": 1.0, "y": 2.0, "z": 0.0, "workspace_id": workspace_id}
+    )
+
+    assert result["success"] is True
+    assert result["entity_id"] in ctrl.agents["inproc_agent"].created_entities
+    assert ctrl._worker_pool.queue.count(None) == ctrl.max_concurrent_agents  # no workers started
+
+
 def test_execute_operation_on_nonexistent_agent_raises_error(controller):
     """
     Test executing operation on nonexistent agent raises KeyError.
@@ -94,6 +94,22 @@ class TestAgentMessage:
         assert reconstructed_msg.content == original_msg.content
         assert reconstructed_msg.timestamp == original_msg.timestamp
 
+    def test_trusted_deserialization(self):
+        """Verify from_dict_trusted rebuilds an equal message."""
+        original_msg = AgentMessage(
+            message_id="msg_001",
+            from_agent_id="agent_a",
+            to_agent_id="agent_b",
+            message_type="request",
+            content={"request_type": "test"},
+            read=True
+        )
+
+        reconstructed_msg = AgentMessage.from_dict_trusted(original_msg.to_dict())
+
+        assert reconstructed_msg == original_msg
+        assert not hasattr(reconstructed_msg, "_send_time")
+
 
 class TestMessageValidation:
     """Tests for validate_message_content function."""
@@ -318,3 +318,23 @@ def test_role_violation_updates_error_metrics(controller, cleanup_workspace):
     assert agent.success_count == 0
     assert len(agent.error_log) > 0
     assert "role" in agent.error_log[0].lower() or "cannot execute" in agent.error_log[0].lower()
+
+
+def test_can_agent_execute_has_no_side_effects(controller, cleanup_workspace):
+    """
+    Test can_agent_execute reports role permissions without touching metrics.
+    """
+    workspace_id = "test_ws_role_probe"
+    cleanup_workspace.append(workspace_id)
+
+    agent = controller.create_agent("role_probe", "designer", workspace_id)
+
+    assert controller.can_agent_execute("role_probe", "entity.create_line") is True
+    assert controller.can_agent_execute("role_probe", "solid.extrude") is False
+
+    assert agent.operation_count == 0
+    assert agent.error_count == 0
+    assert agent.status == "idle"
+
+    with pytest.raises(KeyError):
+        controller.can_agent_execute("missing_agent", "entity.create_line")
@@ -259,6 +259,42 @@ def test_task_dependencies_execution_order(controller):
     # task_a and task_b can be in any order relative to each other (no dependency)
 
 
+def test_task_dependencies_leave_caller_sequence_untouched():
+    """Test TaskAssignment copies dependencies instead of rewriting the caller's list."""
+    from src.multi_agent.task_decomposer import TaskAssignment
+
+    shared_dependencies = ["task_a", "task_b"]
+    task = TaskAssignment(
+        task_id="task_c",
+        agent_id=None,
+        description="Merge base and lid",
+        required_operations=["workspace.merge"],
+        dependencies=shared_dependencies,
+        success_criteria="Components merged",
+        status="pending",
+        assigned_at=None,
+        completed_at=None,
+        result=None
+    )
+    assert task.dependencies == shared_dependencies
+    assert task.dependencies is not shared_dependencies
+
+    # Tuples (e.g. from a frozen workflow definition) are accepted too
+    task = TaskAssignment(
+        task_id="task_d",
+        agent_id=None,
+        description="Inspect merged result",
+        required_operations=["entity.query"],
+        dependencies=("task_c",),
+        success_criteria="Result inspected",
+        status="pending",
+        assigned_at=None,
+        completed_at=None,
+        result=None
+    )
+    assert task.dependencies == ["task_c"]
+
+
 def test_decompose_complex_pattern(controller):
     """
     Additional test: Decompose different patterns to verify decomposer handles variety.
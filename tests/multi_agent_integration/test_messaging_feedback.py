@@ -10,7 +10,7 @@ Verifies:
 
 import pytest
 import time
-import queue
+from collections import deque
 from src.multi_agent.controller import Controller
 from src.multi_agent.roles import RoleTemplate
 from src.multi_agent.messaging import AgentMessage
@@ -73,8 +73,8 @@ class TestMessagingFeedbackLoop:
         controller.agents["designer_1"] = agent_a
         controller.agents["validator_1"] = agent_b
         
-        controller.message_queues["designer_1"] = queue.Queue()
-        controller.message_queues["validator_1"] = queue.Queue()
+        controller.message_queues["designer_1"] = deque()
+        controller.message_queues["validator_1"] = deque()
         
         # 2. Designer sends request to Validator
         controller.send_message(
@@ -130,9 +130,9 @@ class TestMessagingFeedbackLoop:
         controller.agents["agent_b"] = agent_b
         controller.agents["agent_c"] = agent_c
         
-        controller.message_queues["agent_a"] = queue.Queue()
-        controller.message_queues["agent_b"] = queue.Queue()
-        controller.message_queues["agent_c"] = queue.Queue()
+        controller.message_queues["agent_a"] = deque()
+        controller.message_queues["agent_b"] = deque()
+        controller.message_queues["agent_c"] = deque()
         
         # Agent A broadcasts
         controller.send_message(
@@ -171,7 +171,7 @@ class TestMessagingFeedbackLoop:
         
         controller.agents["agent_a"] = agent_a
         controller.agents["agent_b"] = agent_b
-        controller.message_queues["agent_b"] = queue.Queue()
+        controller.message_queues["agent_b"] = deque()
         
         # Send message
         controller.send_message(
@@ -192,3 +192,55 @@ class TestMessagingFeedbackLoop:
         assert hasattr(msg, '_send_time')
         latency = time.time() - msg._send_time
         assert latency >= 0.15
+
+    def test_broadcast_not_delivered_to_later_agents(self, controller):
+        """Verify an agent does not receive broadcasts sent before it existed."""
+        designer_role = controller.role_templates["designer"]
+        from src.multi_agent.controller import Agent
+
+        controller.agents["agent_a"] = Agent(agent_id="agent_a", role=designer_role, workspace_id="ws_a")
+        controller.agents["agent_b"] = Agent(agent_id="agent_b", role=designer_role, workspace_id="ws_b")
+
+        controller.send_message(
+            from_agent_id="agent_a",
+            to_agent_id="broadcast",
+            message_type="broadcast",
+            content={"announcement": "early"}
+        )
+
+        # Agent C joins after the broadcast
+        controller.agents["agent_c"] = Agent(agent_id="agent_c", role=designer_role, workspace_id="ws_c")
+
+        assert controller.get_messages("agent_c") == []
+        assert len(controller.get_messages("agent_b")) == 1
+
+        controller.send_message(
+            from_agent_id="agent_a",
+            to_agent_id="broadcast",
+            message_type="broadcast",
+            content={"announcement": "late"}
+        )
+
+        msgs_c = controller.get_messages("agent_c")
+        assert [msg.content["announcement"] for msg in msgs_c] == ["late"]
+
+    def test_messages_returned_in_arrival_order(self, controller, monkeypatch):
+        """Verify direct messages and broadcasts are returned in arrival order."""
+        designer_role = controller.role_templates["designer"]
+        from src.multi_agent.controller import Agent
+
+        controller.agents["agent_a"] = Agent(agent_id="agent_a", role=designer_role, workspace_id="ws_a")
+        controller.agents["agent_b"] = Agent(agent_id="agent_b", role=designer_role, workspace_id="ws_b")
+
+        # Identical timestamps, as on a coarse clock, must not reorder messages
+        monkeypatch.setattr(time, "time", lambda: 1_000_000.0)
+
+        controller.send_message("agent_a", "broadcast", "broadcast", {"announcement": "first"})
+        controller.send_message("agent_a", "agent_b", "request", {"request_type": "second"})
+        controller.send_message("agent_a", "broadcast", "broadcast", {"announcement": "third"})
+        controller.send_message("agent_a", "agent_b", "request", {"request_type": "fourth"})
+
+        msgs_b = controller.get_messages("agent_b")
+        assert [msg.message_type for msg in msgs_b] == ["broadcast", "request", "broadcast", "request"]
+        assert msgs_b[1].content["request_type"] == "second"
+        assert msgs_b[3].content["request_type"] == "fourth"
@@ -0,0 +1,48 @@
+"""
+Unit tests for OperationHistory incremental metric aggregates.
+
+Verifies the running duration sum and half-window error counts match a
+full re-scan of the history, including once the history is full and the
+oldest records are evicted.
+"""
+
+import random
+
+
+def _rescan(records):
+    """Compute (duration_sum, first_rate, second_rate) by scanning records."""
+    mid = len(records) // 2
+    first, second = records[:mid], records[mid:]
+
+    def rate(ops):
+        return sum(1 for op in ops if not op["success"]) / len(ops) if ops else 0.0
+
+    return sum(op["duration"] for op in records), rate(first), rate(second)
+
+
+def test_aggregates_match_rescan_while_growing_and_evicting():
+    """Aggregates stay exact across growth and eviction."""
+    from src.multi_agent.controller import OperationHistory
+
+    rng = random.Random(42)
+    history = OperationHistory(maxlen=25)
+
+    for _ in range(200):
+        history.append({"success": rng.random() < 0.7, "duration": rng.random()})
+
+        duration_sum, first_rate, second_rate = _rescan(list(history))
+        assert len(history) <= 25
+        assert abs(history.duration_sum - duration_sum) < 1e-9
+        assert history.half_error_rates() == (first_rate, second_rate)
+
+
+def test_clear_resets_aggregates():
+    """Clearing the history resets every aggregate."""
+    from src.multi_agent.controller import OperationHistory
+
+    history = OperationHistory()
+    history.extend([{"success": False, "duration": 1.0}] * 4)
+    history.clear()
+
+    assert history.duration_sum == 0.0
+    assert history.half_error_rates() == (0.0, 0.0)
@@ -0,0 +1,20 @@
+"""Unit tests for entity ID generation."""
+from src.cad_kernel.entity_manager import GeometricEntity
+
+
+def test_generate_entity_ids_batch_format():
+    """Test batch IDs match the single-ID format and are distinct."""
+    single = GeometricEntity.generate_entity_id("main", "solid")
+    batch = GeometricEntity.generate_entity_ids("main", "solid", 100)
+
+    assert len(batch) == 100
+    assert len(set(batch)) == 100
+    for entity_id in batch:
+        assert entity_id.startswith("main:solid_")
+        assert len(entity_id) == len(single)
+        int(entity_id.rsplit("_", 1)[1], 16)
+
+
+def test_generate_entity_ids_empty_batch():
+    """Test requesting zero IDs returns an empty list."""
+    assert GeometricEntity.generate_entity_ids("main", "solid", 0) == []
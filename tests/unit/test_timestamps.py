@@ -0,0 +1,21 @@
+"""Unit tests for shared request timestamps."""
+from datetime import datetime
+
+from src.utils.timestamps import request_timestamp, utc_now_iso
+
+
+def test_request_timestamp_is_shared_within_block():
+    """Test every utc_now_iso() call in a request block returns the same string."""
+    with request_timestamp() as timestamp:
+        assert utc_now_iso() == timestamp
+        assert utc_now_iso() == timestamp
+
+    assert datetime.fromisoformat(timestamp).tzinfo is not None
+
+
+def test_utc_now_iso_outside_request_is_fresh():
+    """Test timestamps are generated per call outside a request block."""
+    with request_timestamp() as timestamp:
+        pass
+
+    assert utc_now_iso() >= timestamp